@@ -26,11 +26,16 @@ def run_server():
     """Run the MCP server."""
     print("Starting MCP Crypto Server...")
     try:
-        # Try FastAPI server first (more reliable)
-        subprocess.run([
-            "uv", "run", "python", "src/fastapi_server.py"
-        ], check=True, cwd=Path(__file__).parent)
-    except subprocess.CalledProcessError:
+        # Replace this process with the server instead of keeping a parent
+        # Python interpreter alive just to wait on a subprocess: one fewer
+        # process, no double signal handling, and Ctrl+C goes straight to
+        # the server.
+        os.chdir(Path(__file__).parent)
+        os.execvp("uv", ["uv", "run", "python", "src/fastapi_server.py"])
+    except FileNotFoundError:
+        print("❌ uv not found. Please install uv first: pip install uv")
+    except OSError:
+        # exec failed after uv was found; fall back to the subprocess chain
         print("❌ FastAPI server failed, trying main server...")
         try:
             subprocess.run([
@@ -38,8 +43,8 @@ def run_server():
             ], check=True, cwd=Path(__file__).parent)
         except subprocess.CalledProcessError:
             print("❌ Failed to start any server")
-    except KeyboardInterrupt:
-        print("\n⏹️ Server stopped by user")
+        except KeyboardInterrupt:
+            print("\n⏹️ Server stopped by user")
 
 def run_tests():
     """Run tests (placeholder for future implementation)."""
@@ -3,32 +3,33 @@
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 def run_command(cmd, description, continue_on_error=True):
-    """Run a command and display results."""
+    """Run a command, streaming its output as it arrives."""
     print(f"🔄 {description}...")
     print(f"   Command: {' '.join(cmd)}")
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    if result.returncode == 0:
+
+    # Stream line-by-line instead of capture_output: the user sees progress
+    # on long runs and peak memory stays flat regardless of output size.
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in process.stdout:
+        print(f"   {line}", end="")
+    returncode = process.wait()
+
+    if returncode == 0:
         print(f"✅ {description} completed successfully")
-        if result.stdout.strip():
-            print(f"   Output: {result.stdout.strip()}")
     else:
         print(f"❌ {description} failed")
-        if result.stderr.strip():
-            print(f"   Error: {result.stderr.strip()}")
-        if result.stdout.strip():
-            print(f"   Output: {result.stdout.strip()}")
-        
+
         if not continue_on_error:
             sys.exit(1)
-    
+
     print()
-    return result.returncode == 0
+    return returncode == 0
 
 
 def main():
@@ -40,16 +41,18 @@ def main():
     project_root = Path(__file__).parent.parent
     os.chdir(project_root)
     
-    # Check if tools are available
+    # Check if tools are available. The version probes are independent
+    # subprocesses, so run them in parallel instead of paying five
+    # interpreter startups back to back.
     tools_to_check = ["black", "isort", "flake8", "mypy", "ruff"]
-    missing_tools = []
-    
-    for tool in tools_to_check:
-        try:
-            subprocess.run(["python", "-m", tool, "--version"], 
-                         capture_output=True, check=True)
-        except subprocess.CalledProcessError:
-            missing_tools.append(tool)
+
+    def check_tool(tool):
+        result = subprocess.run(["python", "-m", tool, "--version"],
+                                capture_output=True)
+        return tool if result.returncode != 0 else None
+
+    with ThreadPoolExecutor(max_workers=len(tools_to_check)) as executor:
+        missing_tools = [tool for tool in executor.map(check_tool, tools_to_check) if tool]
     
     if missing_tools:
         print(f"❌ Missing tools: {', '.join(missing_tools)}")
@@ -7,25 +7,25 @@ from pathlib import Path
 
 
 def run_command(cmd, description):
-    """Run a command and display results."""
+    """Run a command, streaming its output as it arrives."""
     print(f"🔄 {description}...")
     print(f"   Command: {' '.join(cmd)}")
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    if result.returncode == 0:
+
+    # Stream line-by-line instead of capture_output: test progress shows up
+    # live and a verbose pytest run no longer buffers megabytes in memory.
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in process.stdout:
+        print(f"   {line}", end="")
+    returncode = process.wait()
+
+    if returncode == 0:
         print(f"✅ {description} completed successfully")
-        if result.stdout.strip():
-            print(f"   Output: {result.stdout.strip()}")
     else:
         print(f"❌ {description} failed")
-        if result.stderr.strip():
-            print(f"   Error: {result.stderr.strip()}")
-        if result.stdout.strip():
-            print(f"   Output: {result.stdout.strip()}")
-    
+
     print()
-    return result.returncode == 0
+    return returncode == 0
 
 
 def main():
@@ -0,0 +1,17 @@
+"""Process-wide sys.path bootstrap for MCP Crypto Server modules.
+
+Importing this module guarantees the src directory is on sys.path. Every
+module used to run its own membership scan and insert; funneling them
+through this cached import means the O(len(sys.path)) scan happens once
+per process and later importers pay only a sys.modules lookup.
+"""
+
+import sys
+from pathlib import Path
+
+_SRC_PATH = str(Path(__file__).parent)
+
+# Appended rather than head-inserted: every import in the process would
+# otherwise stat this directory first before the stdlib paths
+if _SRC_PATH not in sys.path:
+    sys.path.append(_SRC_PATH)
@@ -5,7 +5,15 @@ This module handles loading and validating configuration from YAML files.
 
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
+
+# Prefer the libyaml C loader/dumper when PyYAML was built with it; the
+# pure-Python SafeLoader is roughly an order of magnitude slower to parse.
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
 from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
 
@@ -46,6 +54,7 @@ class ConfigManager:
         """
         self.config_path = config_path or "config.yml"
         self._config: Optional[Config] = None
+        self._mtime: Optional[int] = None
     
     def load_config(self) -> Config:
         """Load configuration from YAML file.
@@ -58,22 +67,32 @@ class ConfigManager:
             yaml.YAMLError: If config file is invalid YAML
             ValueError: If config validation fails
         """
-        if not os.path.exists(self.config_path):
+        try:
+            # Memoize on the file's mtime: repeated loads short-circuit with a
+            # single stat instead of re-reading and re-parsing the YAML. EAFP
+            # here also means a missing file costs one failed stat, not a
+            # separate exists() check before every open.
+            mtime = os.stat(self.config_path).st_mtime_ns
+        except FileNotFoundError:
             # Create default config if it doesn't exist
             default_config = Config()
             self._save_default_config(default_config)
             return default_config
-        
+
         try:
+            if self._config is not None and mtime == self._mtime:
+                return self._config
+
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
-            
+                config_data = yaml.load(f, Loader=_YamlLoader)
+
             if config_data is None:
                 config_data = {}
-            
+
             self._config = Config(**config_data)
+            self._mtime = mtime
             return self._config
-            
+
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in config file {self.config_path}: {e}")
         except Exception as e:
@@ -92,7 +111,7 @@ class ConfigManager:
         config_dict = config.model_dump()
         
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            yaml.dump(config_dict, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
     
     def get_config(self) -> Config:
         """Get current configuration.
@@ -111,6 +130,7 @@ class ConfigManager:
             Config: Reloaded configuration
         """
         self._config = None
+        self._mtime = None
         return self.load_config()
 
 
@@ -118,9 +138,13 @@ class ConfigManager:
 config_manager = ConfigManager()
 
 
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get global configuration instance.
-    
+
+    Cached so repeated calls are a C-level lru lookup instead of going
+    through the manager's lazy-load check every time.
+
     Returns:
         Config: Global configuration
     """
@@ -129,8 +153,9 @@ def get_config() -> Config:
 
 def reload_config() -> Config:
     """Reload global configuration.
-    
+
     Returns:
         Config: Reloaded global configuration
     """
+    get_config.cache_clear()
     return config_manager.reload_config()
\ No newline at end of file
@@ -5,36 +5,124 @@ This provides a working HTTP server with the same functionality as the FastMCP v
 """
 
 import asyncio
+import hashlib
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException, Request, Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-# Add src to path for absolute imports
-src_path = Path(__file__).parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Serialize responses with orjson (Rust, single C-level pass) when available;
+# fall back to the stdlib-json response class otherwise.
+try:
+    import orjson  # noqa: F401 - required at runtime by ORJSONResponse
+    from fastapi.responses import ORJSONResponse as _DefaultResponseClass
+except ImportError:
+    orjson = None
+    from fastapi.responses import JSONResponse as _DefaultResponseClass
+
+
+def _static_json_bytes(obj) -> bytes:
+    """Serialize a constant once at import time."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Bootstrap sys.path once per process (see _bootstrap); after the
+# first importer, this is a cached sys.modules hit, not a path scan
+if "_bootstrap" not in sys.modules:
+    sys.path.append(str(Path(__file__).parent))
+import _bootstrap  # noqa: F401
 
 from mcp_store.resources.status import get_status_resource
 from mcp_store.resources.tools_list import get_tools_list_resource
 from mcp_store.resources.version import get_version_resource
 from mcp_store.tools.calculator import (
     add_tool,
+    batch_tool,
     divide_tool,
     modulo_tool,
     multiply_tool,
     subtract_tool,
 )
-from utils import get_logger
+from utils import encode_bytes_to_base64, encode_to_base64, get_logger
 
 from config import get_config
 from src.mcp_store.tools.crypto import decrypt_tool, encrypt_tool
 
 logger = get_logger(__name__)
 
+# Dispatch table for the batch endpoint, mapping tool names to coroutines
+_BATCH_TOOLS = {
+    "encrypt": encrypt_tool,
+    "decrypt": decrypt_tool,
+    "add": add_tool,
+    "subtract": subtract_tool,
+    "multiply": multiply_tool,
+    "divide": divide_tool,
+    "modulo": modulo_tool,
+}
+
+# Bound on concurrently running calls within one batch request
+_BATCH_MAX_CONCURRENT = 8
+
+# The root and health responses are fully static, so serialize them once at
+# import; the handlers return the bytes with zero per-request allocation.
+_ROOT_JSON_BYTES = _static_json_bytes({
+    "message": "MCP Crypto Server",
+    "status": "running",
+    "version": "0.1.0",
+    "tools": ["encrypt", "decrypt", "add", "subtract", "multiply", "divide", "modulo"],
+    "resources": ["version", "status", "tools_list"],
+    "endpoints": {
+        "tools": {
+            "encrypt": "POST /tools/encrypt",
+            "decrypt": "POST /tools/decrypt",
+            "add": "POST /tools/add",
+            "subtract": "POST /tools/subtract",
+            "multiply": "POST /tools/multiply",
+            "divide": "POST /tools/divide",
+            "modulo": "POST /tools/modulo"
+        },
+        "resources": {
+            "version": "GET /resources/version",
+            "status": "GET /resources/status",
+            "tools_list": "GET /resources/tools"
+        }
+    }
+})
+
+_HEALTH_JSON_BYTES = _static_json_bytes({"status": "healthy", "server": "MCP Crypto Server"})
+
+# Below this total payload size a batch is encoded inline: thread handoff
+# costs more than the encoding itself for small items.
+_BATCH_PARALLEL_THRESHOLD = 64 * 1024
+
+# Shared pool for large encode batches, built once instead of paying pool
+# construction and teardown inside the request handler
+_ENCODE_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# TTL cache of pre-serialized resource payloads, keyed by resource name.
+# MCP clients poll these endpoints for discovery; a hit skips the resource
+# call and serialization entirely.
+_resource_cache: Dict[str, tuple] = {}
+
+
+async def _get_cached_resource(name: str, ttl: float, fetch) -> str:
+    """Return a cached resource payload, refreshing it after ttl seconds."""
+    now = time.monotonic()
+    entry = _resource_cache.get(name)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    payload = await fetch()
+    _resource_cache[name] = (now + ttl, payload)
+    return payload
+
 
 # Pydantic models for API requests
 class EncryptRequest(BaseModel):
@@ -50,6 +138,44 @@ class CalculatorRequest(BaseModel):
     b: float
 
 
+class BatchEncryptRequest(BaseModel):
+    items: List[str]
+
+
+class BatchRequest(BaseModel):
+    calls: List[Dict[str, Any]]
+
+
+class BatchCalculatorRequest(BaseModel):
+    operation: str
+    a_values: List[float]
+    b_values: List[float]
+
+
+# Build the pydantic-core validators eagerly at import time so the first
+# request does not pay the lazy schema-construction cost.
+for _model in (EncryptRequest, DecryptRequest, CalculatorRequest,
+               BatchEncryptRequest, BatchRequest, BatchCalculatorRequest):
+    _model.model_rebuild()
+
+# Pre-built adapter for the batch endpoint: validate_json on the raw body is
+# one pydantic-core pass, skipping FastAPI's dependency/validation pipeline.
+_BATCH_REQUEST_ADAPTER = TypeAdapter(BatchRequest)
+
+
+async def _dispatch(tool, *args, error_label: str) -> Dict[str, Any]:
+    """Await a tool coroutine, translating failures into HTTP 500s.
+
+    One shared try/except instead of a copy per endpoint keeps each handler
+    body to a single direct await on the success path.
+    """
+    try:
+        return await tool(*args)
+    except Exception as e:
+        logger.error("%s error: %s", error_label, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 def create_fastapi_server() -> FastAPI:
     """Create a FastAPI server with MCP functionality."""
     app = FastAPI(
@@ -57,144 +183,206 @@ def create_fastapi_server() -> FastAPI:
         description="HTTP server providing MCP-style crypto tools and resources",
         version="0.1.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=_DefaultResponseClass
     )
     
     @app.get("/")
-    async def root():
+    async def root() -> Response:
         """Root endpoint with server information."""
-        return {
-            "message": "MCP Crypto Server",
-            "status": "running",
-            "version": "0.1.0",
-            "tools": ["encrypt", "decrypt", "add", "subtract", "multiply", "divide", "modulo"],
-            "resources": ["version", "status", "tools_list"],
-            "endpoints": {
-                "tools": {
-                    "encrypt": "POST /tools/encrypt",
-                    "decrypt": "POST /tools/decrypt",
-                    "add": "POST /tools/add",
-                    "subtract": "POST /tools/subtract",
-                    "multiply": "POST /tools/multiply",
-                    "divide": "POST /tools/divide",
-                    "modulo": "POST /tools/modulo"
-                },
-                "resources": {
-                    "version": "GET /resources/version",
-                    "status": "GET /resources/status",
-                    "tools_list": "GET /resources/tools"
-                }
-            }
-        }
-    
+        return Response(content=_ROOT_JSON_BYTES, media_type="application/json")
+
     @app.get("/health")
-    async def health():
+    async def health() -> Response:
         """Health check endpoint."""
-        return {"status": "healthy", "server": "MCP Crypto Server"}
+        return Response(content=_HEALTH_JSON_BYTES, media_type="application/json")
     
     # Tool endpoints
     @app.post("/tools/encrypt")
     async def encrypt_endpoint(request: EncryptRequest) -> Dict[str, Any]:
         """Encrypt text to base64."""
+        return await _dispatch(encrypt_tool, request.text, error_label="Encrypt endpoint")
+    
+    @app.post("/tools/encrypt/raw")
+    async def encrypt_raw_endpoint(request: Request) -> Response:
+        """Encode the raw request body to base64.
+
+        Fast path for binary payloads (e.g. n8n attachments): the body is
+        encoded bytes-to-bytes with no pydantic model and no UTF-8 round-trip,
+        and the JSON envelope is assembled from pre-encoded scaffolding.
+        """
         try:
-            result = await encrypt_tool(request.text)
-            return result
+            body = await request.body()
+            encoded = encode_bytes_to_base64(body)
+            return Response(
+                content=b'{"success":true,"error":null,"result":"' + encoded + b'"}',
+                media_type="application/json"
+            )
         except Exception as e:
-            logger.error(f"Encrypt endpoint error: {e}")
+            logger.error("Encrypt raw endpoint error: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
-    
-    @app.post("/tools/decrypt")
-    async def decrypt_endpoint(request: DecryptRequest) -> Dict[str, Any]:
-        """Decrypt base64 text."""
+
+    @app.post("/tools/encrypt/batch")
+    async def encrypt_batch_endpoint(request: BatchEncryptRequest) -> Dict[str, Any]:
+        """Encode a list of strings to base64 in a single round-trip.
+
+        Amortizes the per-request HTTP and validation overhead across a whole
+        n8n item list. Large batches fan out over a thread pool — pybase64
+        releases the GIL for sizeable inputs, so threads encode in parallel —
+        while small batches are encoded inline to skip the handoff cost.
+        """
         try:
-            result = await decrypt_tool(request.encoded_text)
-            return result
+            items = request.items
+            if sum(len(item) for item in items) > _BATCH_PARALLEL_THRESHOLD:
+                # Await the pool instead of blocking the event loop on a
+                # synchronous map; other requests keep running meanwhile
+                loop = asyncio.get_running_loop()
+                results = list(await asyncio.gather(
+                    *(loop.run_in_executor(_ENCODE_POOL, encode_to_base64, item)
+                      for item in items)
+                ))
+            else:
+                results = [encode_to_base64(item) for item in items]
+            return {"success": True, "error": None, "result": results}
+        except Exception as e:
+            logger.error("Encrypt batch endpoint error: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @app.post("/tools/batch")
+    async def batch_endpoint(request: Request) -> Dict[str, Any]:
+        """Execute several tool calls in one request.
+
+        Each call is {"tool": name, "args": {...}}. The calls run
+        concurrently via asyncio.gather (bounded by a semaphore), so a
+        batch of N pays one HTTP round-trip instead of N. Per-call
+        failures are reported in place without failing the batch. The body
+        is parsed with a pre-built TypeAdapter straight off the raw bytes,
+        bypassing the FastAPI dependency pipeline for this hot endpoint.
+        """
+        try:
+            batch = _BATCH_REQUEST_ADAPTER.validate_json(await request.body())
+        except ValidationError as e:
+            # include_input=False keeps raw body bytes out of the detail,
+            # which the JSON error response could not serialize
+            raise HTTPException(
+                status_code=422,
+                detail=e.errors(include_url=False, include_input=False)
+            )
+        try:
+            semaphore = asyncio.Semaphore(_BATCH_MAX_CONCURRENT)
+
+            async def run_call(call: Dict[str, Any]) -> Dict[str, Any]:
+                tool = _BATCH_TOOLS.get(call.get("tool"))
+                if tool is None:
+                    return {
+                        "success": False,
+                        "error": f"Unknown tool: {call.get('tool')}",
+                        "result": None
+                    }
+                async with semaphore:
+                    return await tool(**call.get("args", {}))
+
+            results = await asyncio.gather(
+                *(run_call(call) for call in batch.calls),
+                return_exceptions=True
+            )
+            results = [
+                result if not isinstance(result, BaseException)
+                else {"success": False, "error": str(result), "result": None}
+                for result in results
+            ]
+            return {"success": True, "error": None, "result": results}
         except Exception as e:
-            logger.error(f"Decrypt endpoint error: {e}")
+            logger.error("Batch endpoint error: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
+
+    @app.post("/tools/decrypt")
+    async def decrypt_endpoint(request: DecryptRequest) -> Dict[str, Any]:
+        """Decrypt base64 text."""
+        return await _dispatch(decrypt_tool, request.encoded_text, error_label="Decrypt endpoint")
     
     @app.post("/tools/add")
     async def add_endpoint(request: CalculatorRequest) -> Dict[str, Any]:
         """Add two numbers."""
-        try:
-            result = await add_tool(request.a, request.b)
-            return result
-        except Exception as e:
-            logger.error(f"Add endpoint error: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
+        return await _dispatch(add_tool, request.a, request.b, error_label="Add endpoint")
     
     @app.post("/tools/subtract")
     async def subtract_endpoint(request: CalculatorRequest) -> Dict[str, Any]:
         """Subtract second number from first."""
-        try:
-            result = await subtract_tool(request.a, request.b)
-            return result
-        except Exception as e:
-            logger.error(f"Subtract endpoint error: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
+        return await _dispatch(subtract_tool, request.a, request.b, error_label="Subtract endpoint")
     
     @app.post("/tools/multiply")
     async def multiply_endpoint(request: CalculatorRequest) -> Dict[str, Any]:
         """Multiply two numbers."""
-        try:
-            result = await multiply_tool(request.a, request.b)
-            return result
-        except Exception as e:
-            logger.error(f"Multiply endpoint error: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
+        return await _dispatch(multiply_tool, request.a, request.b, error_label="Multiply endpoint")
     
     @app.post("/tools/divide")
     async def divide_endpoint(request: CalculatorRequest) -> Dict[str, Any]:
         """Divide first number by second."""
-        try:
-            result = await divide_tool(request.a, request.b)
-            return result
-        except Exception as e:
-            logger.error(f"Divide endpoint error: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
+        return await _dispatch(divide_tool, request.a, request.b, error_label="Divide endpoint")
     
+    @app.post("/tools/calculate/batch")
+    async def calculate_batch_endpoint(request: BatchCalculatorRequest) -> Dict[str, Any]:
+        """Apply one calculator operation across paired operand lists."""
+        return await _dispatch(batch_tool, request.operation,
+                               request.a_values, request.b_values,
+                               error_label="Calculate batch endpoint")
+
     @app.post("/tools/modulo")
     async def modulo_endpoint(request: CalculatorRequest) -> Dict[str, Any]:
         """Calculate remainder of first number divided by second."""
-        try:
-            result = await modulo_tool(request.a, request.b)
-            return result
-        except Exception as e:
-            logger.error(f"Modulo endpoint error: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
+        return await _dispatch(modulo_tool, request.a, request.b, error_label="Modulo endpoint")
     
     # Resource endpoints
     @app.get("/resources/version")
-    async def version_endpoint():
+    async def version_endpoint() -> Response:
         """Get server version information."""
         try:
-            import json
-            version_data = await get_version_resource()
-            return json.loads(version_data)
+            # The resource is already serialized JSON; return it as-is
+            # instead of parsing and re-serializing per request.
+            # Version data is immutable for a running server
+            version_data = await _get_cached_resource("version", 3600, get_version_resource)
+            return Response(content=version_data, media_type="application/json")
         except Exception as e:
-            logger.error(f"Version endpoint error: {e}")
+            logger.error("Version endpoint error: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
-    
+
     @app.get("/resources/status")
-    async def status_endpoint():
+    async def status_endpoint() -> Response:
         """Get server status information."""
         try:
-            import json
-            status_data = await get_status_resource()
-            return json.loads(status_data)
+            # One second of staleness keeps uptime/CPU readings useful while
+            # collapsing polling bursts into a single psutil sample
+            status_data = await _get_cached_resource("status", 1, get_status_resource)
+            return Response(content=status_data, media_type="application/json")
         except Exception as e:
-            logger.error(f"Status endpoint error: {e}")
+            logger.error("Status endpoint error: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
     
     @app.get("/resources/tools")
-    async def tools_list_endpoint():
-        """Get available tools information."""
+    async def tools_list_endpoint(request: Request) -> Response:
+        """Get available tools information.
+
+        The tool catalog only changes on deploy, so the response carries
+        Cache-Control and an ETag: repeat clients (and any CDN/proxy in
+        front) get a body-less 304 instead of re-serializing the catalog.
+        """
         try:
-            import json
-            tools_data = await get_tools_list_resource()
-            return json.loads(tools_data)
+            # The catalog only changes on deploy; 60s bounds the window
+            tools_data = await _get_cached_resource("tools", 60, get_tools_list_resource)
+            etag = f'"{hashlib.md5(tools_data).hexdigest()}"'
+            headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            # The resource is already serialized JSON; pass it through
+            # instead of parsing and re-serializing it.
+            return Response(
+                content=tools_data,
+                media_type="application/json",
+                headers=headers
+            )
         except Exception as e:
-            logger.error(f"Tools list endpoint error: {e}")
+            logger.error("Tools list endpoint error: %s", e)
             raise HTTPException(status_code=500, detail=str(e))
     
     return app
@@ -205,33 +393,54 @@ async def run_server():
     try:
         config = get_config()
         
-        # Override with environment variables if set
-        if os.getenv("MCP_HOST"):
-            config.server.host = os.getenv("MCP_HOST")
+        # Override with environment variables if set (single lookup each)
+        env_host = os.getenv("MCP_HOST")
+        if env_host:
+            config.server.host = env_host
 
-        if os.getenv("MCP_PORT"):
-            config.server.port = int(os.getenv("MCP_PORT"))
+        env_port = os.getenv("MCP_PORT")
+        if env_port:
+            config.server.port = int(env_port)
             
         logger.info("Creating FastAPI-based MCP server...")
         app = create_fastapi_server()
         
-        logger.info(f"Starting server on {config.server.host}:{config.server.port}")
+        logger.info("Starting server on %s:%d", config.server.host, config.server.port)
         
         import uvicorn
-        
+
+        # uvicorn[standard] ships uvloop and httptools; request them explicitly
+        # so the event loop and HTTP parser don't silently fall back to the
+        # slower asyncio/h11 implementations.
+        loop_impl = "auto"
+        http_impl = "auto"
+        if sys.platform != "win32":
+            try:
+                import uvloop  # noqa: F401
+                loop_impl = "uvloop"
+            except ImportError:
+                pass
+            try:
+                import httptools  # noqa: F401
+                http_impl = "httptools"
+            except ImportError:
+                pass
+
         uvicorn_config = uvicorn.Config(
             app=app,
             host=config.server.host,
             port=config.server.port,
             log_level="info",
-            access_log=True
+            access_log=True,
+            loop=loop_impl,
+            http=http_impl
         )
         
         server = uvicorn.Server(uvicorn_config)
         await server.serve()
         
     except Exception as e:
-        logger.error(f"Failed to start FastAPI server: {e}")
+        logger.error("Failed to start FastAPI server: %s", e)
         raise
 
 
@@ -242,7 +451,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         raise
 
 
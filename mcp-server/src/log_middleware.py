@@ -4,6 +4,7 @@ This module provides logging middleware functionality to log inputs and outputs
 for all MCP tools.
 """
 
+import asyncio
 import functools
 import json
 import inspect
@@ -12,33 +13,97 @@ import logging
 from pathlib import Path
 from typing import Any, Callable, Dict, Awaitable
 
-# Add src to path for absolute imports
-src_path = Path(__file__).parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Bootstrap sys.path once per process (see _bootstrap); after the
+# first importer, this is a cached sys.modules hit, not a path scan
+if "_bootstrap" not in sys.modules:
+    sys.path.append(str(Path(__file__).parent))
+import _bootstrap  # noqa: F401
 
-# Try different import paths based on how the module is used
+# The bootstrap guarantees src is importable, so a single absolute import
+# replaces the old three-deep try/except ladder; the basic fallback stays
+# for environments where utils itself cannot load
 try:
-    from utils import get_logger
+    from utils import get_logger, sanitize_input, truncate_string
 except ImportError:
-    try:
-        from src.utils import get_logger
-    except ImportError:
-        try:
-            from .utils import get_logger
-        except ImportError:
-            # Fallback to basic logger if all imports fail
-            def get_logger(name):
-                logger = logging.getLogger(name)
-                if not logger.handlers:
-                    handler = logging.StreamHandler(sys.stdout)
-                    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-                    logger.addHandler(handler)
-                    logger.setLevel(logging.INFO)
-                return logger
+    # Fallback to basic logger if the import fails
+    def get_logger(name):
+        logger = logging.getLogger(name)
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+        return logger
+
+    def sanitize_input(text):
+        return text
+
+    def truncate_string(text, max_length=100):
+        return text
 
 logger = get_logger(__name__)
 
+# orjson encodes roughly 2x faster than stdlib json and skips the
+# intermediate str until the final decode; fall back when not installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, default=str)
+
+
+# Serializers resolved once per concrete argument type: every hasattr is a
+# try/except AttributeError inside the interpreter, and tools see the same
+# argument types call after call, so the probe result is cached by type
+_SERIALIZER_CACHE: Dict[type, Any] = {}
+_UNRESOLVED = object()
+
+
+def _resolve_serializer(arg):
+    """Probe an argument once for the richest dump method available.
+
+    Returns a callable producing a loggable representation for object-like
+    arguments, or None for primitives that can be logged as-is.
+    """
+    if not hasattr(arg, '__dict__'):
+        return None
+    if hasattr(arg, "model_dump"):
+        return lambda a: a.model_dump()
+    if hasattr(arg, "dict"):
+        return lambda a: a.dict()
+    return lambda a: a.__dict__
+
+
+# Strong references to in-flight output-logging tasks; create_task alone
+# only holds a weak reference and the task could be collected mid-log
+_log_tasks = set()
+
+
+async def _log_output(tool_name, params_str, result):
+    """Serialize and log a completed tool call off the request critical path.
+
+    Parameters and result go out in one record, so each call pays the
+    handler pipeline (formatting, lock, I/O) once instead of twice.
+    """
+    try:
+        # Resources already return serialized JSON strings; dumping those
+        # again would escape-quote the whole payload for no benefit
+        if isinstance(result, str):
+            result_repr = result
+        elif isinstance(result, (bytes, bytearray)):
+            result_repr = result.decode("utf-8", "replace")
+        else:
+            result_repr = _dumps(result)
+        result_str = truncate_string(sanitize_input(result_repr), 500)
+        logger.info("TOOL CALL: %s - Parameters: %s - Result: %s",
+                    tool_name, params_str, result_str)
+    except Exception as e:
+        logger.warning("Failed to log call for tool %s: %s", tool_name, e)
+
+
 def log_tool_calls(func):
     """
     Decorator to log tool inputs and outputs.
@@ -53,77 +118,91 @@ def log_tool_calls(func):
         Wrapped function that logs inputs and outputs
     """
     func_name = func.__name__
-    
+
+    # Resolve the signature once at decoration time; inspect.signature per
+    # call is the dominant wrapper cost for small tool calls
+    _sig_param_names = tuple(inspect.signature(func).parameters.keys())
+
+    # The tool name and the leading-self skip are fixed per function, so
+    # resolve them here instead of re-probing on every call
+    tool_name = getattr(func, "name", None) or func_name
+    _start_idx = 1 if _sig_param_names and _sig_param_names[0] in ("self", "cls") else 0
+    _param_names = _sig_param_names[_start_idx:]
+
+    # Bind logger methods in the closure so each log line costs a fast
+    # local load instead of an attribute lookup on the module logger
+    _warn = logger.warning
+    _error = logger.error
+
     @functools.wraps(func)
     async def async_wrapper(*args, **kwargs):
-        # Get tool name from function or name attribute if available
-        tool_name = getattr(func, "__name__", "unknown_tool")
-        if hasattr(func, "name") and func.name:
-            tool_name = func.name
-            
-        # Log the input parameters (safely)
-        try:
-            # Extract and format parameters for logging
-            params_dict = {}
-            
-            # Process positional arguments except self
-            if len(args) > 0 and not isinstance(args[0], str) and not hasattr(args[0], '__dict__'):
-                # Skip first arg if it's self (instance)
-                start_idx = 1
-            else:
-                start_idx = 0
-                
-            # Get function signature to identify parameter names
-            sig = inspect.signature(func)
-            param_names = list(sig.parameters.keys())[start_idx:]
-            
-            # Match positional args with their parameter names
-            for i, arg in enumerate(args[start_idx:]):
-                if i < len(param_names):
-                    param_name = param_names[i]
-                else:
-                    param_name = f"arg{i}"
-                    
-                # Try to get a string representation that's safe to log
-                if hasattr(arg, '__dict__'):
-                    # For objects, log a summary
-                    params_dict[param_name] = f"{arg.__class__.__name__}(...)"
-                    # Try to log object attributes if Pydantic model or similar
-                    if hasattr(arg, "model_dump"):
-                        params_dict[f"{param_name}_data"] = arg.model_dump()
-                    elif hasattr(arg, "dict"):
-                        params_dict[f"{param_name}_data"] = arg.dict()
-                    elif hasattr(arg, "__dict__"):
-                        params_dict[f"{param_name}_data"] = arg.__dict__
-                else:
-                    # For primitive types
-                    params_dict[param_name] = arg
-                    
-            # Add kwargs
-            params_dict.update(kwargs)
-            
-            # Format for logging
-            params_str = json.dumps(params_dict, default=str)
-            logger.info(f"TOOL INPUT: {tool_name} - Parameters: {params_str}")
-        except Exception as e:
-            logger.warning(f"Failed to log input for tool {tool_name}: {str(e)}")
-        
+        # When INFO is disabled, skip the parameter walk and serialization
+        # entirely: the wrapper degrades to a bare await of the tool
+        log_io = logger.isEnabledFor(logging.INFO)
+
+        # Capture the input parameters (safely); they are buffered and
+        # emitted with the result in a single combined record
+        params_str = None
+        if log_io:
+            try:
+                # Collect (name, value) pairs in a flat list; the dict is
+                # materialized once at dump time instead of growing (and
+                # resizing) per assignment
+                params = []
+                append = params.append
+
+                # Match positional args with the parameter names resolved
+                # at decoration time (self, if any, already skipped)
+                for i, arg in enumerate(args[_start_idx:]):
+                    if i < len(_param_names):
+                        param_name = _param_names[i]
+                    else:
+                        param_name = f"arg{i}"
+
+                    # Try to get a string representation that's safe to log
+                    serializer = _SERIALIZER_CACHE.get(type(arg), _UNRESOLVED)
+                    if serializer is _UNRESOLVED:
+                        serializer = _resolve_serializer(arg)
+                        _SERIALIZER_CACHE[type(arg)] = serializer
+
+                    if serializer is not None:
+                        # For objects, log the dumped attributes directly;
+                        # a separate ClassName(...) stub would just double
+                        # the keys serialized per model argument
+                        append((param_name, serializer(arg)))
+                    else:
+                        # For primitive types
+                        append((param_name, arg))
+
+                # Add kwargs
+                params.extend(kwargs.items())
+
+                # Format for logging
+                # Sanitize in one C-level translate pass so user-supplied control
+                # characters cannot mangle or forge log lines
+                # Cap what reaches the log: multi-KB payloads would otherwise be
+                # sanitized and written out in full on every call
+                params_str = truncate_string(sanitize_input(_dumps(dict(params))), 500)
+            except Exception as e:
+                _warn("Failed to log input for tool %s: %s", tool_name, e)
+
         # Execute the actual function
         try:
             result = await func(*args, **kwargs)
-            
-            # Log the result (safely)
-            try:
-                result_str = json.dumps(result, default=str)
-                logger.info(f"TOOL OUTPUT: {tool_name} - Result: {result_str}")
-            except Exception as e:
-                logger.warning(f"Failed to log output for tool {tool_name}: {str(e)}")
-                
+
+            # Log the call (safely) in the background so the caller gets
+            # their result without waiting for serialization and log I/O
+            if log_io:
+                task = asyncio.create_task(_log_output(tool_name, params_str, result))
+                _log_tasks.add(task)
+                task.add_done_callback(_log_tasks.discard)
+
             return result
             
         except Exception as e:
-            # Log the exception
-            logger.error(f"TOOL ERROR: {tool_name} - Exception: {str(e)}")
+            # Log the exception together with the captured parameters
+            _error("TOOL ERROR: %s - Parameters: %s - Exception: %s",
+                   tool_name, params_str, e)
             raise
             
     # Return the async wrapper
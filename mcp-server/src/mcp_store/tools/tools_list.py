@@ -3,21 +3,59 @@
 This tool provides information about available tools with their schemas and descriptions.
 """
 
+import asyncio
+import functools
 import json
 import sys
 import inspect
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-# Add src to path for absolute imports
-src_path = Path(__file__).parent.parent.parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Bootstrap sys.path once per process (see _bootstrap); after the
+# first importer, this is a cached sys.modules hit, not a path scan
+if "_bootstrap" not in sys.modules:
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from src.utils import get_logger
 
+# Hoisted out of the fallback branch so steady-state calls skip the
+# per-call IMPORT_NAME/sys.modules probe. Guarded: the resource module
+# imports list_tools from here, so during a circular first import this
+# module can be only partially initialized and the import fails; the
+# fallback branch then resolves it lazily once.
+try:
+    from src.mcp_store.resources.tools_list import get_tools_list_resource
+except ImportError:
+    get_tools_list_resource = None
+
 logger = get_logger(__name__)
 
+# orjson parses a few times faster than stdlib json and takes the
+# resource's bytes payload directly; fall back when not installed
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Cache of extracted tool info keyed by (tool object id, tool name, detailed).
+# Reflection (inspect.signature, attribute probing) is expensive and tool
+# objects are stable for the lifetime of the app, so extract once per tool.
+_tool_info_cache: Dict[Any, Dict[str, Any]] = {}
+
+# Registry attribute resolved once per app instance (keyed by id); the
+# attribute scan below walks up to five hasattr probes and only ever
+# resolves to the same answer for a given app
+_registry_attr_cache: Dict[int, Optional[str]] = {}
+_UNRESOLVED = object()
+
+# Static-fallback views parsed once per process: (detailed tools,
+# simplified tools, categories). The underlying resource payload never
+# changes at runtime, so later fallback calls skip the resource await,
+# the JSON parse and the per-entry summarization entirely.
+_static_cache: Optional[tuple] = None
+_static_cache_lock = asyncio.Lock()
+
 
 async def list_tools(detailed: bool = False, app=None) -> Dict[str, Any]:
     """List available tools with their schemas and descriptions.
@@ -47,20 +85,27 @@ async def list_tools(detailed: bool = False, app=None) -> Dict[str, Any]:
             # Get tools directly from FastMCP app's tool registry
             logger.info("Getting tools from FastMCP app instance")
             
-            # Access the actual tool registry - FastMCP stores tools in different attributes
+            # Access the actual tool registry - FastMCP stores tools in
+            # different attributes; which one wins is fixed per app, so the
+            # probe result is cached and later calls do a single getattr
             tools_registry = None
-            
-            # Try different possible attributes where FastMCP might store tools
-            for attr in ['_tools', 'tools', '_tool_registry', 'tool_registry', '_resources']:
-                if hasattr(app, attr):
-                    potential_registry = getattr(app, attr)
-                    logger.info(f"Found attribute '{attr}': {type(potential_registry)}")
-                    
-                    # Check if it's a dict-like structure
-                    if hasattr(potential_registry, 'items') or hasattr(potential_registry, '__getitem__'):
-                        tools_registry = potential_registry
-                        logger.info(f"Using '{attr}' as tools registry")
-                        break
+            registry_attr = _registry_attr_cache.get(id(app), _UNRESOLVED)
+            if registry_attr is _UNRESOLVED:
+                registry_attr = None
+                # Try different possible attributes where FastMCP might store tools
+                for attr in ['_tools', 'tools', '_tool_registry', 'tool_registry', '_resources']:
+                    potential_registry = getattr(app, attr, None)
+                    if potential_registry is not None:
+                        logger.info(f"Found attribute '{attr}': {type(potential_registry)}")
+
+                        # Check if it's a dict-like structure
+                        if hasattr(potential_registry, 'items') or hasattr(potential_registry, '__getitem__'):
+                            registry_attr = attr
+                            logger.info(f"Using '{attr}' as tools registry")
+                            break
+                _registry_attr_cache[id(app)] = registry_attr
+            if registry_attr is not None:
+                tools_registry = getattr(app, registry_attr)
             
             if not tools_registry:
                 logger.warning("Could not find tools registry in app, falling back to static resource")
@@ -69,7 +114,9 @@ async def list_tools(detailed: bool = False, app=None) -> Dict[str, Any]:
             else:
                 # Process tools from registry
                 tools_list = []
-                categories = set()
+                # Insertion-ordered dict as the dedup set; iterating it
+                # later yields a list without a set->list cast
+                categories = {}
                 
                 # Handle dict-like registry
                 if hasattr(tools_registry, 'items'):
@@ -80,64 +127,58 @@ async def list_tools(detailed: bool = False, app=None) -> Dict[str, Any]:
                 
                 for tool_name, tool_obj in items:
                     logger.info(f"Processing tool: {tool_name}, type: {type(tool_obj)}")
-                    
-                    # Extract tool information
-                    tool_info = _extract_tool_info(tool_name, tool_obj, detailed)
+
+                    # Extract tool information (cached so reflection runs once per tool)
+                    cache_key = (id(tool_obj), tool_name, detailed)
+                    tool_info = _tool_info_cache.get(cache_key)
+                    if tool_info is None:
+                        tool_info = _extract_tool_info(tool_name, tool_obj, detailed)
+                        _tool_info_cache[cache_key] = tool_info
                     
                     # Determine category
                     category = _determine_category(tool_info["name"])
                     if category:
                         tool_info["category"] = category
-                        categories.add(category)
+                        categories[category] = None
                     
                     tools_list.append(tool_info)
                     logger.info(f"Extracted tool info: {json.dumps(tool_info, indent=2)}")
+
+                categories = list(categories)
         
         # Fallback to static resource if app not provided or registry not found
         if not app:
             logger.info("Using static resource for tools list")
-            from src.mcp_store.resources.tools_list import get_tools_list_resource
-            
-            # Get the full tools list from the resource
-            tools_json = await get_tools_list_resource()
-            tools_data = json.loads(tools_json)
-            
-            # Process tools based on detail level
-            if not detailed:
-                # For non-detailed view, simplify the output
-                simplified_tools = []
-                for tool in tools_data.get("tools", []):
-                    tool_dict = {
-                        "name": tool.get("name", ""),
-                        "description": tool.get("description", ""),
-                    }
-                    
-                    params = tool.get("parameters", {})
-                    if params:
-                        tool_dict["parameters_summary"] = _summarize_params(params)
-                    
-                    returns = tool.get("returns", {})
-                    if returns:
-                        tool_dict["returns_summary"] = _summarize_returns(returns)
-                    
-                    category = tool.get("category")
-                    if category:
-                        tool_dict["category"] = category
-                    
-                    simplified_tools.append(tool_dict)
-                
-                tools_list = simplified_tools
-            else:
-                # For detailed view, use full data
-                tools_list = tools_data.get("tools", [])
-            
-            categories = tools_data.get("categories", [])
+            global _static_cache
+            if _static_cache is None:
+                # Lock so concurrent first calls parse and summarize once
+                async with _static_cache_lock:
+                    if _static_cache is None:
+                        fetch = get_tools_list_resource
+                        if fetch is None:
+                            # Deferred resolution for the circular-import case
+                            from src.mcp_store.resources.tools_list import \
+                                get_tools_list_resource as fetch
+
+                        # Get the full tools list from the resource and
+                        # precompute both detail views at fill time
+                        tools_json = await fetch()
+                        tools_data = _loads(tools_json)
+                        detailed_tools = tools_data.get("tools", [])
+                        _static_cache = (
+                            detailed_tools,
+                            list(map(_simplify_tool, detailed_tools)),
+                            tools_data.get("categories", []),
+                        )
+
+            detailed_tools, simplified_tools, categories = _static_cache
+            tools_list = detailed_tools if detailed else simplified_tools
         
         result = {
             "success": True,
             "tools": tools_list,
             "count": len(tools_list),
-            "categories": list(categories) if isinstance(categories, set) else categories,
+            "categories": categories,
             "error": None
         }
         
@@ -156,6 +197,35 @@ async def list_tools(detailed: bool = False, app=None) -> Dict[str, Any]:
         }
 
 
+def _simplify_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a full static tool entry to its summary form.
+
+    Args:
+        tool: Full tool entry from the static resource
+
+    Returns:
+        Dictionary with name/description plus optional summaries
+    """
+    tool_dict = {
+        "name": tool.get("name", ""),
+        "description": tool.get("description", ""),
+    }
+
+    params = tool.get("parameters")
+    if params:
+        tool_dict["parameters_summary"] = _summarize_params(params)
+
+    returns = tool.get("returns")
+    if returns:
+        tool_dict["returns_summary"] = _summarize_returns(returns)
+
+    category = tool.get("category")
+    if category:
+        tool_dict["category"] = category
+
+    return tool_dict
+
+
 def _extract_tool_info(tool_name: str, tool_obj: Any, detailed: bool = False) -> Dict[str, Any]:
     """Extract all available information from a tool object.
     
@@ -180,10 +250,11 @@ def _extract_tool_info(tool_name: str, tool_obj: Any, detailed: bool = False) ->
     description = None
     
     # Try direct attributes
+    # One getattr with a default replaces each hasattr/getattr pair; every
+    # hasattr is itself a full getattr that throws away the value
     for attr in ['description', 'desc', '__doc__']:
-        if hasattr(tool_obj, attr):
-            val = getattr(tool_obj, attr)
-            if val and isinstance(val, str) and "str(object=" not in val:
+        val = getattr(tool_obj, attr, None)
+        if val and isinstance(val, str) and "str(object=" not in val:
                 description = val.strip()
                 logger.info(f"Found description in {attr}: {description[:100]}")
                 break
@@ -191,14 +262,13 @@ def _extract_tool_info(tool_name: str, tool_obj: Any, detailed: bool = False) ->
     # Try nested function/handler
     if not description:
         for fn_attr in ['fn', 'func', 'handler', 'callback', '_fn']:
-            if hasattr(tool_obj, fn_attr):
-                fn = getattr(tool_obj, fn_attr)
-                if fn and callable(fn):
-                    fn_doc = inspect.getdoc(fn)
-                    if fn_doc and "str(object=" not in fn_doc:
-                        description = fn_doc
-                        logger.info(f"Found description in {fn_attr}.__doc__: {description[:100]}")
-                        break
+            fn = getattr(tool_obj, fn_attr, None)
+            if fn and callable(fn):
+                fn_doc = inspect.getdoc(fn)
+                if fn_doc and "str(object=" not in fn_doc:
+                    description = fn_doc
+                    logger.info(f"Found description in {fn_attr}.__doc__: {description[:100]}")
+                    break
     
     tool_info["description"] = description or ""
     
@@ -221,8 +291,8 @@ def _extract_tool_info(tool_name: str, tool_obj: Any, detailed: bool = False) ->
             tool_info["returns_summary"] = _summarize_returns(returns)
     
     # Extract examples if available
-    if detailed and hasattr(tool_obj, 'examples'):
-        examples = getattr(tool_obj, 'examples')
+    if detailed:
+        examples = getattr(tool_obj, 'examples', None)
         if examples:
             tool_info["examples"] = examples
     
@@ -240,48 +310,46 @@ def _extract_input_schema(tool_obj: Any) -> Optional[Dict[str, Any]]:
     """
     # Try to get input schema from various attributes
     for schema_attr in ['input_schema', 'inputSchema', 'parameters_schema', 'params_schema', 'schema']:
-        if hasattr(tool_obj, schema_attr):
-            schema = getattr(tool_obj, schema_attr)
-            
-            if schema:
-                # Handle dict-based schema
-                if isinstance(schema, dict):
-                    return schema.get('properties', schema)
-                # Handle object with properties
-                elif hasattr(schema, 'properties'):
-                    props = schema.properties
-                    if isinstance(props, dict):
-                        return props
-                # Handle Pydantic model
-                elif hasattr(schema, 'model_fields'):
-                    return {
-                        name: {
-                            "type": _get_field_type(field),
-                            "description": field.description or ""
-                        }
-                        for name, field in schema.model_fields.items()
+        schema = getattr(tool_obj, schema_attr, None)
+
+        if schema:
+            # Handle dict-based schema
+            if isinstance(schema, dict):
+                return schema.get('properties', schema)
+            # Handle object with properties
+            elif hasattr(schema, 'properties'):
+                props = schema.properties
+                if isinstance(props, dict):
+                    return props
+            # Handle Pydantic model
+            elif hasattr(schema, 'model_fields'):
+                return {
+                    name: {
+                        "type": _get_field_type(field),
+                        "description": field.description or ""
                     }
+                    for name, field in schema.model_fields.items()
+                }
     
     # Try to extract from function signature
     for fn_attr in ['fn', 'func', 'handler', 'callback', '_fn']:
-        if hasattr(tool_obj, fn_attr):
-            fn = getattr(tool_obj, fn_attr)
-            if fn and callable(fn):
-                try:
-                    sig = inspect.signature(fn)
-                    params = {}
-                    for param_name, param in sig.parameters.items():
-                        if param_name not in ['self', 'cls']:
-                            param_info = {
-                                "type": str(param.annotation) if param.annotation != inspect.Parameter.empty else "any",
-                                "required": param.default == inspect.Parameter.empty
-                            }
-                            params[param_name] = param_info
-                    if params:
-                        logger.info(f"Extracted params from function signature: {params}")
-                        return params
-                except Exception as e:
-                    logger.warning(f"Could not extract signature: {e}")
+        fn = getattr(tool_obj, fn_attr, None)
+        if fn and callable(fn):
+            try:
+                sig = inspect.signature(fn)
+                params = {}
+                for param_name, param in sig.parameters.items():
+                    if param_name not in ['self', 'cls']:
+                        param_info = {
+                            "type": str(param.annotation) if param.annotation != inspect.Parameter.empty else "any",
+                            "required": param.default == inspect.Parameter.empty
+                        }
+                        params[param_name] = param_info
+                if params:
+                    logger.info(f"Extracted params from function signature: {params}")
+                    return params
+            except Exception as e:
+                logger.warning(f"Could not extract signature: {e}")
     
     return None
 
@@ -296,16 +364,15 @@ def _extract_output_schema(tool_obj: Any) -> Optional[Dict[str, Any]]:
         Output schema dictionary or None
     """
     for schema_attr in ['output_schema', 'outputSchema', 'return_schema', 'returns_schema', 'response_schema']:
-        if hasattr(tool_obj, schema_attr):
-            schema = getattr(tool_obj, schema_attr)
-            
-            if schema:
-                if isinstance(schema, dict):
-                    return schema.get('properties', schema)
-                elif hasattr(schema, 'properties'):
-                    props = schema.properties
-                    if isinstance(props, dict):
-                        return props
+        schema = getattr(tool_obj, schema_attr, None)
+
+        if schema:
+            if isinstance(schema, dict):
+                return schema.get('properties', schema)
+            elif hasattr(schema, 'properties'):
+                props = schema.properties
+                if isinstance(props, dict):
+                    return props
     
     return None
 
@@ -327,26 +394,33 @@ def _get_field_type(field) -> str:
     return "any"
 
 
+# Static keyword -> category mapping walked once per (cached) lookup
+# instead of the old inline if/elif cascade rebuilding keyword lists
+_CATEGORY_KEYWORDS = (
+    ("crypto", ("encrypt", "decrypt", "crypto", "hash")),
+    ("calculator", ("add", "subtract", "multiply", "divide", "modulo", "calculate")),
+    ("execution", ("script", "exec", "run")),
+    ("discovery", ("list", "get_tools", "discover")),
+)
+
+
+@functools.lru_cache(maxsize=256)
 def _determine_category(tool_name: str) -> Optional[str]:
     """Determine category from tool name.
-    
+
+    The tool set is fixed for the lifetime of the app, so results are
+    memoized per name and the substring scans run once per tool.
+
     Args:
         tool_name: Name of the tool
-        
+
     Returns:
         Category string or None
     """
     name_lower = tool_name.lower()
-    
-    if "encrypt" in name_lower or "decrypt" in name_lower or "crypto" in name_lower or "hash" in name_lower:
-        return "crypto"
-    elif any(op in name_lower for op in ["add", "subtract", "multiply", "divide", "modulo", "calculate"]):
-        return "calculator"
-    elif "script" in name_lower or "exec" in name_lower or "run" in name_lower:
-        return "execution"
-    elif "list" in name_lower or "get_tools" in name_lower or "discover" in name_lower:
-        return "discovery"
-    
+    for category, keywords in _CATEGORY_KEYWORDS:
+        if any(keyword in name_lower for keyword in keywords):
+            return category
     return None
 
 
@@ -359,22 +433,19 @@ def _summarize_params(params: Dict[str, Any]) -> List[Dict[str, Any]]:
     Returns:
         List of simplified parameter information
     """
-    summary = []
-    for name, info in params.items():
-        param_summary = {
+    # A single comprehension builds the list without per-iteration append
+    # bytecode; optional keys are merged in only when present, matching
+    # the old conditional assignments
+    return [
+        {
             "name": name,
-            "type": info.get("type", "any") if isinstance(info, dict) else "any",
+            "type": info.get("type", "any"),
+            **{key: info[key] for key in ("description", "required") if key in info},
         }
-        
-        if isinstance(info, dict):
-            if "description" in info:
-                param_summary["description"] = info["description"]
-            if "required" in info:
-                param_summary["required"] = info["required"]
-        
-        summary.append(param_summary)
-    
-    return summary
+        if isinstance(info, dict)
+        else {"name": name, "type": "any"}
+        for name, info in params.items()
+    ]
 
 
 def _summarize_returns(returns: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -386,16 +457,13 @@ def _summarize_returns(returns: Dict[str, Any]) -> List[Dict[str, Any]]:
     Returns:
         List of simplified return value information
     """
-    summary = []
-    for name, info in returns.items():
-        return_summary = {
+    return [
+        {
             "name": name,
-            "type": info.get("type", "any") if isinstance(info, dict) else "any",
+            "type": info.get("type", "any"),
+            **{key: info[key] for key in ("description",) if key in info},
         }
-        
-        if isinstance(info, dict) and "description" in info:
-            return_summary["description"] = info["description"]
-        
-        summary.append(return_summary)
-    
-    return summary
\ No newline at end of file
+        if isinstance(info, dict)
+        else {"name": name, "type": "any"}
+        for name, info in returns.items()
+    ]
\ No newline at end of file
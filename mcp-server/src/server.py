@@ -35,10 +35,11 @@ try:
 except ImportError:
     print("Warning: python-dotenv not installed. .env file will not be loaded automatically.")
 
-# Add src to path for absolute imports
-src_path = Path(__file__).parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Bootstrap sys.path once per process (see _bootstrap); after the
+# first importer, this is a cached sys.modules hit, not a path scan
+if "_bootstrap" not in sys.modules:
+    sys.path.append(str(Path(__file__).parent))
+import _bootstrap  # noqa: F401
 
 from mcp_store.resources.status import get_status_resource
 from mcp_store.resources.tools_list import get_tools_list_resource
@@ -59,40 +60,97 @@ from src.mcp_store.tools.crypto import decrypt_tool, encrypt_tool
 from src.mcp_store.tools.tools_list import list_tools
 
 
+logger = get_logger(__name__)
+
+
+# Parameter processing functions (module-level so the function objects are
+# created once at import instead of per create_server call)
+def _process_encrypt_params(raw_params):
+    """Process encrypt parameters from various formats."""
+    # Log only the shape of the payload: interpolating the full value costs a
+    # str() of arbitrarily large input on every call (and leaks it into logs).
+    logger.debug(f"Processing encrypt params (type: {type(raw_params)})")
+
+    if isinstance(raw_params, str):
+        return raw_params
+    elif isinstance(raw_params, dict):
+        if 'text' in raw_params:
+            return raw_params['text']
+        else:
+            raise ValueError("Object format requires 'text' property")
+    elif hasattr(raw_params, 'text'):
+        return raw_params.text
+    else:
+        raise ValueError(f"Parameters must be a string or an object with 'text' property. Got: {type(raw_params)}")
+
+
+def _process_decrypt_params(raw_params):
+    """Process decrypt parameters from various formats."""
+    logger.debug(f"Processing decrypt params (type: {type(raw_params)})")
+
+    if isinstance(raw_params, str):
+        return raw_params
+    elif isinstance(raw_params, dict):
+        if 'text' in raw_params:
+            return raw_params['text']
+        else:
+            raise ValueError("Object format requires 'text' property")
+    elif hasattr(raw_params, 'text'):
+        return raw_params.text
+    else:
+        raise ValueError(f"Parameters must be a string or an object with 'text' property. Got: {type(raw_params)}")
+
+
+def _process_calculator_params(raw_params):
+    """Process calculator parameters from various formats."""
+    logger.debug(f"Processing calculator params (type: {type(raw_params)})")
+
+    if isinstance(raw_params, list):
+        if len(raw_params) != 2:
+            raise ValueError("Calculator requires exactly 2 parameters")
+        return raw_params[0], raw_params[1]
+    elif isinstance(raw_params, dict):
+        if 'a' not in raw_params or 'b' not in raw_params:
+            raise ValueError("Object format requires 'a' and 'b' properties")
+        return raw_params['a'], raw_params['b']
+    elif hasattr(raw_params, 'a') and hasattr(raw_params, 'b'):
+        return raw_params.a, raw_params.b
+    else:
+        raise ValueError(f"Parameters must be an array of 2 numbers or an object with 'a' and 'b' properties. Got: {type(raw_params)}")
+
+
 # Helper functions for response formatting
+# Pre-allocated response templates; unpacking a template copies its keys in
+# C rather than rebuilding the literal per call.
+_RESPONSE_TEMPLATE = {"success": True, "data": None, "message": ""}
+_ERROR_RESPONSE_TEMPLATE = {"success": False, "error": None, "error_code": "ERROR"}
+
+
 def format_response(data: Any, success: bool = True, message: str = "") -> Dict[str, Any]:
     """Format a successful response.
-    
+
     Args:
         data: Response data
         success: Success status
         message: Optional message
-        
+
     Returns:
         dict: Formatted response
     """
-    return {
-        "success": success,
-        "data": data,
-        "message": message
-    }
+    return {**_RESPONSE_TEMPLATE, "success": success, "data": data, "message": message}
 
 
 def format_error_response(error: str, error_code: str = "ERROR") -> Dict[str, Any]:
     """Format an error response.
-    
+
     Args:
         error: Error message
         error_code: Error code
-        
+
     Returns:
         dict: Formatted error response
     """
-    return {
-        "success": False,
-        "error": error,
-        "error_code": error_code
-    }
+    return {**_ERROR_RESPONSE_TEMPLATE, "error": error, "error_code": error_code}
 
 
 def validate_config(config) -> bool:
@@ -265,56 +323,6 @@ def create_server(server_name="MCP Crypto Server"):
 def _setup_mcp_tools(server: FastMCP, logger) -> None:
     """Set up MCP tools using FastMCP decorators with enhanced metadata."""
     logger.info("Setting up MCP tools")
-    
-    # Parameter processing functions
-    def _process_encrypt_params(raw_params):
-        """Process encrypt parameters from various formats."""
-        logger.info(f"Processing encrypt params: {raw_params} (type: {type(raw_params)})")
-        
-        if isinstance(raw_params, str):
-            return raw_params
-        elif isinstance(raw_params, dict):
-            if 'text' in raw_params:
-                return raw_params['text']
-            else:
-                raise ValueError("Object format requires 'text' property")
-        elif hasattr(raw_params, 'text'):
-            return raw_params.text
-        else:
-            raise ValueError(f"Parameters must be a string or an object with 'text' property. Got: {type(raw_params)}")
-    
-    def _process_decrypt_params(raw_params):
-        """Process decrypt parameters from various formats."""
-        logger.debug(f"Processing decrypt params: {raw_params} (type: {type(raw_params)})")
-        
-        if isinstance(raw_params, str):
-            return raw_params
-        elif isinstance(raw_params, dict):
-            if 'text' in raw_params:
-                return raw_params['text']
-            else:
-                raise ValueError("Object format requires 'text' property")
-        elif hasattr(raw_params, 'text'):
-            return raw_params.text
-        else:
-            raise ValueError(f"Parameters must be a string or an object with 'text' property. Got: {type(raw_params)}")
-
-    def _process_calculator_params(raw_params):
-        """Process calculator parameters from various formats."""
-        logger.debug(f"Processing calculator params: {raw_params} (type: {type(raw_params)})")
-        
-        if isinstance(raw_params, list):
-            if len(raw_params) != 2:
-                raise ValueError("Calculator requires exactly 2 parameters")
-            return raw_params[0], raw_params[1]
-        elif isinstance(raw_params, dict):
-            if 'a' not in raw_params or 'b' not in raw_params:
-                raise ValueError("Object format requires 'a' and 'b' properties")
-            return raw_params['a'], raw_params['b']
-        elif hasattr(raw_params, 'a') and hasattr(raw_params, 'b'):
-            return raw_params.a, raw_params.b
-        else:
-            raise ValueError(f"Parameters must be an array of 2 numbers or an object with 'a' and 'b' properties. Got: {type(raw_params)}")
 
     # Script execution tool
     @server.tool(name="executeScript", description="Execute a script in the environment. Accepts a Python script as a string and runs it safely. Returns execution result or error.")
@@ -475,7 +483,9 @@ def _setup_mcp_resources(server: FastMCP, logger) -> None:
     async def version_resource() -> str:
         """Get current MCP server version and build information."""
         logger.info("Version resource requested")
-        return await get_version_resource()
+        # The resource returns pre-serialized UTF-8 bytes; decode here so
+        # MCP clients get TextResourceContents rather than a base64 blob
+        return (await get_version_resource()).decode("utf-8")
     
     @server.resource(
         "resource://mcp/status",
@@ -501,10 +511,10 @@ def _setup_mcp_resources(server: FastMCP, logger) -> None:
         logger.info("Tools list resource requested")
         
         try:
-            return await get_tools_list_resource(app=server)
+            return (await get_tools_list_resource(app=server)).decode("utf-8")
         except Exception as e:
             logger.error(f"Error retrieving tools list: {str(e)}")
-            return await get_tools_list_resource()
+            return (await get_tools_list_resource()).decode("utf-8")
     
     logger.info("MCP resources setup completed")
 
@@ -730,12 +740,14 @@ def main():
         if args.port:
             config.server.port = args.port
 
-        # Override with environment variables if set
-        if os.getenv("MCP_HOST"):
-            config.server.host = os.getenv("MCP_HOST")
+        # Override with environment variables if set (single lookup each)
+        env_host = os.getenv("MCP_HOST")
+        if env_host:
+            config.server.host = env_host
 
-        if os.getenv("MCP_PORT"):
-            config.server.port = int(os.getenv("MCP_PORT"))
+        env_port = os.getenv("MCP_PORT")
+        if env_port:
+            config.server.port = int(env_port)
             
         # Setup logging
         logger = setup_logging(config.logging)
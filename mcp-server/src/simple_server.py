@@ -7,10 +7,11 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add src to path for absolute imports
-src_path = Path(__file__).parent
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Bootstrap sys.path once per process (see _bootstrap); after the
+# first importer, this is a cached sys.modules hit, not a path scan
+if "_bootstrap" not in sys.modules:
+    sys.path.append(str(Path(__file__).parent))
+import _bootstrap  # noqa: F401
 
 from config import get_config
 from utils import get_logger, setup_logging
@@ -76,7 +77,7 @@ async def run_fastmcp_server():
             await server.serve()
             
     except Exception as e:
-        logger.error(f"Failed to start server: {e}")
+        logger.error("Failed to start server: %s", e)
         raise
 
 
@@ -87,7 +88,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         raise
 
 
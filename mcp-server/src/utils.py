@@ -8,11 +8,31 @@ import base64
 import binascii
 import logging
 import os
+import re
 import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, Union
 
+# Prefer pybase64's SIMD-accelerated codec when available. It keeps the
+# stdlib base64 API (including binascii.Error on invalid input), so the
+# stdlib module works as a transparent fallback.
+try:
+    import pybase64
+
+    _b64encode_as_string = pybase64.b64encode_as_string
+    _b64encode = pybase64.b64encode
+    _b64decode = pybase64.b64decode
+except ImportError:
+    pybase64 = None
+
+    def _b64encode_as_string(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+    _b64encode = base64.b64encode
+    _b64decode = base64.b64decode
+
 # Handle imports - try different import paths based on how the module is used
 try:
     # Try relative import first (when used as a package)
@@ -25,10 +45,56 @@ except ImportError:
         # Fallback to direct import (when in the same directory)
         from config import LoggingConfig, get_config
 
+# Translate table deleting control characters (keeping tab/newline/CR).
+# str.translate applies it in a single C-level pass, so sanitizing a large
+# string costs one scan instead of a per-character Python loop.
+_CTRL_DELETE = {c: None for c in range(32) if c not in (9, 10, 13)}
+
+# Base64 alphabet with up to two trailing padding chars. fullmatch on a pure
+# character-class pattern runs in C at scan speed, so invalid input is
+# rejected without paying for a full decode attempt.
+_B64_RE = re.compile(r'^[A-Za-z0-9+/]*={0,2}$')
+
 # Cache for logging configuration
 _logging_configured = False
 _logging_config_cache = None
 
+# Log level names to numeric values; a dict hit beats getattr walking the
+# logging module's namespace. Read-only proxy so nothing mutates it.
+_LEVELS = MappingProxyType({
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+})
+
+# Formatter cache keyed by format string; pytest fixtures call setup_logging
+# repeatedly and Formatter construction need only happen once per format.
+_formatter_cache: dict = {}
+
+
+class _AutoFlushStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves routine records in the stream buffer.
+
+    The stock StreamHandler flushes after every record, which under DEBUG
+    means a write syscall per log line. This variant lets the stream batch
+    writes and only forces a flush at WARNING and above, so problems still
+    hit the console immediately. logging.shutdown() flushes all handlers
+    at interpreter exit, covering anything still buffered.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
 def setup_logging(logging_config: LoggingConfig) -> logging.Logger:
     """Set up logging configuration for console and file output.
@@ -53,17 +119,30 @@ def setup_logging(logging_config: LoggingConfig) -> logging.Logger:
     
     # Configure root logger
     logger = logging.getLogger("mcp_crypto_server")
-    logger.setLevel(getattr(logging, logging_config.level.upper(), logging.INFO))
-    
-    # Remove existing handlers to avoid duplicates
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    logger.setLevel(_LEVELS.get(logging_config.level.upper(), logging.INFO))
     
-    # Create formatter
-    formatter = logging.Formatter(logging_config.format)
+    # Remove existing handlers to avoid duplicates; clear() resets the list
+    # in one step instead of N removeHandler list walks
+    logger.handlers.clear()
+
+    # Create formatter (reused across setup_logging calls)
+    formatter = _formatter_cache.get(logging_config.format)
+    if formatter is None:
+        formatter = logging.Formatter(logging_config.format)
+        _formatter_cache[logging_config.format] = formatter
+
+    # Every LogRecord collects thread/process info at construction time; if
+    # the configured format never renders those fields, turn the collection
+    # off so each log call skips the threading/os lookups.
+    fmt = logging_config.format or ""
+    if "thread" not in fmt:
+        logging.logThreads = False
+    if "process" not in fmt:
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
     
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Console handler (batched writes, immediate flush on WARNING+)
+    console_handler = _AutoFlushStreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG)
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
@@ -83,7 +162,12 @@ def setup_logging(logging_config: LoggingConfig) -> logging.Logger:
     logger.addHandler(file_handler)
     
     logger.debug("Logging configured successfully")
-    
+
+    if pybase64 is not None:
+        # Lets deployments verify which pybase64 build (and SIMD support)
+        # is in use; get_version appends the SIMD kernel name when active
+        logger.debug("pybase64 codec: %s", pybase64.get_version())
+
     return logger
 
 
@@ -137,9 +221,8 @@ def encode_to_base64(text: str) -> str:
     try:
         # Convert string to bytes using UTF-8 encoding
         text_bytes = text.encode('utf-8')
-        # Encode to base64 and decode back to string
-        encoded_bytes = base64.b64encode(text_bytes)
-        return encoded_bytes.decode('ascii')
+        # Encode to base64 directly as a string (skips an intermediate bytes->str hop)
+        return _b64encode_as_string(text_bytes)
     except UnicodeEncodeError as e:
         raise UnicodeEncodeError(
             e.encoding, e.object, e.start, e.end,
@@ -147,6 +230,28 @@ def encode_to_base64(text: str) -> str:
         )
 
 
+def encode_bytes_to_base64(data: Union[bytes, bytearray, memoryview]) -> bytes:
+    """Encode a bytes-like object to base64 bytes.
+
+    Unlike encode_to_base64, this takes the payload as-is: no UTF-8 encode
+    and no str round-trip, so a memoryview over a request body is encoded
+    without copying it first.
+
+    Args:
+        data: Bytes-like payload to encode
+
+    Returns:
+        bytes: Base64 encoded bytes
+
+    Raises:
+        TypeError: If input is not a bytes-like object
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise TypeError("Input must be a bytes-like object")
+
+    return _b64encode(data)
+
+
 def decode_from_base64(encoded_text: str) -> str:
     """Decode base64 string back to original text.
     
@@ -166,19 +271,100 @@ def decode_from_base64(encoded_text: str) -> str:
     
     try:
         # Decode from base64
-        decoded_bytes = base64.b64decode(encoded_text)
+        decoded_bytes = _b64decode(encoded_text)
+        # Fast path: isascii() is a single C-level scan, and ASCII bytes are
+        # trivially valid UTF-8, so the common case skips the UTF-8 state
+        # machine and can never hit the UnicodeDecodeError branch below.
+        if decoded_bytes.isascii():
+            return decoded_bytes.decode('ascii')
         # Convert bytes back to string using UTF-8
         return decoded_bytes.decode('utf-8')
+    except binascii.Error as e:
+        raise ValueError(f"Invalid base64 input: {str(e)}")
+    except UnicodeDecodeError:
+        # Re-raise as-is; reconstructing the exception just copies the
+        # (potentially large) offending bytes into a second error object.
+        raise
     except Exception as e:
-        if isinstance(e, binascii.Error):
-            raise ValueError(f"Invalid base64 input: {str(e)}")
-        elif isinstance(e, UnicodeDecodeError):
-            raise UnicodeDecodeError(
-                e.encoding, e.object, e.start, e.end,
-                f"Unable to decode bytes to UTF-8: {e.reason}"
-            )
-        else:
-            raise ValueError(f"Decoding failed: {str(e)}")
+        raise ValueError(f"Decoding failed: {str(e)}")
+
+
+def safe_decode(data: Union[bytes, bytearray], encoding: str = 'utf-8',
+                max_len: int = 1024) -> str:
+    """Decode bytes to text without raising on binary input.
+
+    Valid text decodes on the fast path. Invalid text is decoded with
+    replacement characters, and payloads that are mostly binary fall back
+    to a hex dump capped at max_len bytes, so a multi-megabyte blob never
+    balloons into a hex string twice its size.
+
+    Args:
+        data: Bytes to decode
+        encoding: Text encoding to try first
+        max_len: Maximum number of bytes represented in the hex fallback
+
+    Returns:
+        str: Decoded text, replacement-decoded text, or capped hex dump
+
+    Raises:
+        TypeError: If input is not bytes or bytearray
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        raise TypeError("Input must be bytes or bytearray")
+
+    try:
+        return data.decode(encoding)
+    except UnicodeDecodeError:
+        pass
+
+    replaced = data.decode(encoding, errors='replace')
+    # More than a quarter replacement characters means this is binary data,
+    # not slightly mangled text; a capped hex dump is more useful and avoids
+    # allocating hex for the whole buffer.
+    if replaced.count('�') * 4 > len(replaced):
+        return binascii.b2a_hex(data[:max_len]).decode('ascii')
+    return replaced
+
+
+def sanitize_input(text: str) -> str:
+    """Strip non-printable control characters from a string.
+
+    Tab, newline and carriage return are kept; all other characters below
+    0x20 are deleted. Intended for cleaning user-supplied text before it is
+    interpolated into log messages.
+
+    Args:
+        text: Input string to sanitize
+
+    Returns:
+        str: Sanitized string
+
+    Raises:
+        TypeError: If input is not a string
+    """
+    if not isinstance(text, str):
+        raise TypeError("Input must be a string")
+
+    return text.translate(_CTRL_DELETE)
+
+
+def truncate_string(text: str, max_length: int = 100) -> str:
+    """Truncate a string for display, appending an ellipsis when cut.
+
+    The common (short) case returns the original string without slicing
+    or allocating anything.
+
+    Args:
+        text: Input string
+        max_length: Maximum length of the returned string
+
+    Returns:
+        str: The original string, or a truncated copy ending in '...'
+    """
+    if len(text) <= max_length:
+        return text
+
+    return f"{text[:max_length - 3]}..."
 
 
 def validate_base64(encoded_text: str) -> bool:
@@ -190,10 +376,20 @@ def validate_base64(encoded_text: str) -> bool:
     Returns:
         bool: True if valid base64, False otherwise
     """
+    if not isinstance(encoded_text, str):
+        return False
+    # Cheap structural checks first: wrong length or characters outside the
+    # base64 alphabet can never decode, so skip the decode attempt entirely.
+    if len(encoded_text) % 4 != 0 or not _B64_RE.fullmatch(encoded_text):
+        return False
     try:
-        decode_from_base64(encoded_text)
+        # Still decode: structurally valid base64 may decode to bytes that
+        # are not valid UTF-8, which this server treats as invalid input.
+        # The type and structure checks above already passed, so call the
+        # codec directly rather than re-validating via decode_from_base64.
+        _b64decode(encoded_text).decode('utf-8')
         return True
-    except (TypeError, ValueError, UnicodeDecodeError):
+    except (binascii.Error, ValueError, UnicodeDecodeError):
         return False
 
 
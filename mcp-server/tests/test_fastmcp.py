@@ -311,8 +311,156 @@ class TestFastAPIMCPServer:
         assert "Modulo by zero is not allowed" in data["error"]
         assert data["result"] is None
     
-    # Test Error Handling
+    # Test Batch Calculator Endpoint
+
+    def test_calculate_batch_success(self, client):
+        """Test batch calculation applies one operation across pairs."""
+        payload = {"operation": "add", "a_values": [1, 2, 3], "b_values": [4, 5, 6]}
+        response = client.post("/tools/calculate/batch", json=payload)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["success"] is True
+        assert data["result"] == [5, 7, 9]
+        assert data["error"] is None
     
+    def test_calculate_batch_matches_single_divide(self, client):
+        """Test batch division uses the same integer rules as /tools/divide."""
+        payload = {"operation": "divide", "a_values": [10, 10], "b_values": [5, 4]}
+        response = client.post("/tools/calculate/batch", json=payload)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["success"] is True
+        # Clean division downcasts to int, uneven division stays float
+        assert data["result"] == [2, 2.5]
+    
+    def test_calculate_batch_zero_error(self, client):
+        """Test batch division by zero reports the failing index."""
+        payload = {"operation": "divide", "a_values": [10, 1], "b_values": [2, 0]}
+        response = client.post("/tools/calculate/batch", json=payload)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["success"] is False
+        assert "Division by zero is not allowed" in data["error"]
+        assert "index 1" in data["error"]
+    
+    def test_calculate_batch_unknown_operation(self, client):
+        """Test batch calculation with an unknown operation."""
+        payload = {"operation": "power", "a_values": [1], "b_values": [2]}
+        response = client.post("/tools/calculate/batch", json=payload)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["success"] is False
+        assert "Unknown operation" in data["error"]
+    
+    def test_calculate_batch_length_mismatch(self, client):
+        """Test batch calculation with mismatched operand lists."""
+        payload = {"operation": "add", "a_values": [1, 2], "b_values": [3]}
+        response = client.post("/tools/calculate/batch", json=payload)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["success"] is False
+        assert "same length" in data["error"]
+    
+    # Test Batch Tool Endpoint
+
+    def test_batch_success(self, client):
+        """Test a batch of mixed tool calls succeeds in one request."""
+        payload = {"calls": [
+            {"tool": "encrypt", "args": {"text": "Test"}},
+            {"tool": "add", "args": {"a": 2, "b": 3}},
+        ]}
+        response = client.post("/tools/batch", json=payload)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["success"] is True
+        assert data["result"][0]["success"] is True
+        assert data["result"][0]["result"] == "VGVzdA=="
+        assert data["result"][1]["success"] is True
+        assert data["result"][1]["result"] == 5
+
+    def test_batch_per_call_failure(self, client):
+        """Test a failing call is reported in place without failing the batch."""
+        payload = {"calls": [
+            {"tool": "divide", "args": {"a": 1, "b": 0}},
+            {"tool": "add", "args": {"not_an_arg": 1}},
+            {"tool": "add", "args": {"a": 1, "b": 1}},
+        ]}
+        response = client.post("/tools/batch", json=payload)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["success"] is True
+        # Tool-level failure comes back as the tool's own error payload
+        assert data["result"][0]["success"] is False
+        assert "Division by zero is not allowed" in data["result"][0]["error"]
+        # A call that raises is converted to an in-place error entry
+        assert data["result"][1]["success"] is False
+        assert data["result"][1]["error"] is not None
+        # Later calls still run
+        assert data["result"][2]["result"] == 2
+
+    def test_batch_unknown_tool(self, client):
+        """Test an unknown tool name yields an in-place error entry."""
+        payload = {"calls": [{"tool": "nonexistent", "args": {}}]}
+        response = client.post("/tools/batch", json=payload)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["success"] is True
+        assert data["result"][0]["success"] is False
+        assert "Unknown tool: nonexistent" in data["result"][0]["error"]
+
+    def test_batch_malformed_body(self, client):
+        """Test a malformed batch body returns a clean validation error."""
+        response = client.post("/tools/batch", content=b"not json at all")
+        assert response.status_code == 422
+        assert "detail" in response.json()
+
+    # Test Encrypt Batch and Raw Endpoints
+
+    def test_encrypt_batch_success(self, client):
+        """Test encoding a list of strings in one request."""
+        payload = {"items": ["Hello, World!", "Test"]}
+        response = client.post("/tools/encrypt/batch", json=payload)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["success"] is True
+        assert data["error"] is None
+        assert data["result"] == ["SGVsbG8sIFdvcmxkIQ==", "VGVzdA=="]
+
+    def test_encrypt_batch_large_items(self, client):
+        """Test a large batch (parallel path) matches the inline encoding."""
+        import base64
+        items = ["a" * 40000, "b" * 40000]  # crosses the parallel threshold
+        response = client.post("/tools/encrypt/batch", json={"items": items})
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["success"] is True
+        expected = [base64.b64encode(item.encode()).decode() for item in items]
+        assert data["result"] == expected
+
+    def test_encrypt_raw_success(self, client):
+        """Test the raw endpoint encodes arbitrary body bytes."""
+        import base64
+        body = b"\x00\x01binary payload\xff"
+        response = client.post("/tools/encrypt/raw", content=body)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["success"] is True
+        assert data["error"] is None
+        assert data["result"] == base64.b64encode(body).decode("ascii")
+
+    # Test Error Handling
+
     def test_invalid_tool_endpoint(self, client):
         """Test calling non-existent tool endpoint."""
         response = client.post("/tools/nonexistent", json={})
@@ -0,0 +1,84 @@
+"""
+Tests for the ScriptExecutor sandbox.
+
+Covers the curated builtins namespace (class statements, type(),
+raising), import validation and result coercion.
+"""
+
+import sys
+import logging
+import pytest
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.mcp_store.tools.ScriptExecutor import ScriptExecutor, _coerce_jsonable
+
+
+@pytest.fixture
+def executor():
+    """Create a ScriptExecutor with a quiet logger."""
+    return ScriptExecutor(logging.getLogger("test_script_executor"))
+
+
+class TestScriptExecutor:
+    """Test class for ScriptExecutor."""
+
+    def test_class_statement(self, executor):
+        """Test a script defining and using a class executes."""
+        script = (
+            "class Doubler:\n"
+            "    def apply(self, x):\n"
+            "        return x * 2\n"
+            "result = Doubler().apply(21)\n"
+        )
+        assert executor.execute_script(script) == {"result": 42}
+
+    def test_type_builtin(self, executor):
+        """Test type() is available to scripts."""
+        assert executor.execute_script("result = type(3).__name__") == {"result": "int"}
+
+    def test_raise_common_exception(self, executor):
+        """Test scripts can raise stock exceptions by name."""
+        with pytest.raises(RuntimeError, match="boom"):
+            executor.execute_script("raise RuntimeError('boom')")
+
+    def test_allowed_import(self, executor):
+        """Test imports of safe modules work."""
+        result = executor.execute_script("import math\nresult = math.floor(2.9)")
+        assert result == {"result": 2}
+
+    def test_disallowed_import_rejected(self, executor):
+        """Test imports outside safe_modules are rejected."""
+        with pytest.raises(RuntimeError, match="not allowed"):
+            executor.execute_script("import os\nresult = os.getpid()")
+
+    def test_namespace_filters_callables(self, executor):
+        """Test functions and classes are dropped from the returned namespace."""
+        script = (
+            "def helper():\n"
+            "    return 1\n"
+            "value = helper()\n"
+        )
+        assert executor.execute_script(script) == {"value": 1}
+
+    def test_result_coerced_to_str(self, executor):
+        """Test non-JSON-native results come back as their str() form."""
+        script = "import datetime\nresult = datetime.datetime(2020, 1, 1)"
+        assert executor.execute_script(script) == {"result": "2020-01-01 00:00:00"}
+
+
+class TestCoerceJsonable:
+    """Test class for _coerce_jsonable."""
+
+    def test_native_values_pass_through(self):
+        """Test JSON-native values are returned unchanged."""
+        value = {"a": [1, 2.5, None, True, "x"]}
+        assert _coerce_jsonable(value) is value
+
+    def test_non_native_value_stringified(self):
+        """Test non-serializable values fall back to str()."""
+        assert _coerce_jsonable({1, 2}) == "{1, 2}"
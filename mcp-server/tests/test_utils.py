@@ -0,0 +1,107 @@
+"""
+Tests for the string and bytes helpers in src/utils.py.
+
+Covers safe_decode, sanitize_input, truncate_string and
+encode_bytes_to_base64.
+"""
+
+import sys
+import base64
+import pytest
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from src.utils import (
+    safe_decode,
+    sanitize_input,
+    truncate_string,
+    encode_bytes_to_base64,
+)
+
+
+class TestSafeDecode:
+    """Test class for safe_decode."""
+
+    def test_valid_utf8(self):
+        """Test valid UTF-8 bytes decode on the fast path."""
+        assert safe_decode("héllo".encode("utf-8")) == "héllo"
+
+    def test_mostly_text_uses_replacement(self):
+        """Test slightly mangled text decodes with replacement characters."""
+        assert safe_decode(b"abc\xffdef") == "abc�def"
+
+    def test_binary_falls_back_to_hex(self):
+        """Test mostly-binary input comes back as a hex dump."""
+        assert safe_decode(b"\xff\xfe\xfd\xfc") == "fffefdfc"
+
+    def test_hex_fallback_is_capped(self):
+        """Test the hex fallback only covers max_len bytes."""
+        assert safe_decode(b"\xff" * 100, max_len=4) == "ffffffff"
+
+    def test_rejects_non_bytes(self):
+        """Test non-bytes input raises TypeError."""
+        with pytest.raises(TypeError):
+            safe_decode("already a string")
+
+
+class TestSanitizeInput:
+    """Test class for sanitize_input."""
+
+    def test_strips_control_characters(self):
+        """Test control characters are removed."""
+        assert sanitize_input("a\x00b\x1bc") == "abc"
+
+    def test_keeps_whitespace_controls(self):
+        """Test tab, newline and carriage return are preserved."""
+        assert sanitize_input("a\tb\nc\rd") == "a\tb\nc\rd"
+
+    def test_plain_text_unchanged(self):
+        """Test clean text passes through untouched."""
+        assert sanitize_input("Hello, World!") == "Hello, World!"
+
+    def test_rejects_non_string(self):
+        """Test non-string input raises TypeError."""
+        with pytest.raises(TypeError):
+            sanitize_input(b"bytes")
+
+
+class TestTruncateString:
+    """Test class for truncate_string."""
+
+    def test_short_string_unchanged(self):
+        """Test strings within the limit are returned as-is."""
+        assert truncate_string("short", max_length=10) == "short"
+
+    def test_long_string_truncated(self):
+        """Test long strings are cut to max_length with an ellipsis."""
+        result = truncate_string("x" * 50, max_length=10)
+        assert result == "xxxxxxx..."
+        assert len(result) == 10
+
+    def test_exact_length_unchanged(self):
+        """Test a string exactly at the limit is not truncated."""
+        text = "x" * 10
+        assert truncate_string(text, max_length=10) == text
+
+
+class TestEncodeBytesToBase64:
+    """Test class for encode_bytes_to_base64."""
+
+    def test_encodes_bytes(self):
+        """Test bytes input is encoded to base64 bytes."""
+        assert encode_bytes_to_base64(b"Hello, World!") == b"SGVsbG8sIFdvcmxkIQ=="
+
+    def test_accepts_memoryview(self):
+        """Test a memoryview is encoded without copying first."""
+        payload = b"\x00\x01\x02binary"
+        expected = base64.b64encode(payload)
+        assert encode_bytes_to_base64(memoryview(payload)) == expected
+
+    def test_rejects_str(self):
+        """Test str input raises TypeError (use encode_to_base64 instead)."""
+        with pytest.raises(TypeError):
+            encode_bytes_to_base64("not bytes")